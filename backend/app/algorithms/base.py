@@ -2,6 +2,7 @@
 
 from abc import ABC, abstractmethod
 from typing import Dict, Any, List, Optional
+import numpy as np
 import pandas as pd
 from datetime import datetime
 
@@ -36,7 +37,10 @@ class AnomalyDetectionAlgorithm(ABC):
             config: Algorithm-specific configuration
             
         Returns:
-            DataFrame with columns: transaction_id, score, confidence, metadata
+            DataFrame with columns: transaction_id, score, confidence, and
+            either metadata (one dict per transaction) or algorithm-specific
+            detail columns (e.g. z_score, window_mean) carrying the same
+            information; consumers must not assume metadata is present
         """
         pass
     
@@ -84,24 +88,32 @@ class AnomalyDetectionAlgorithm(ABC):
         if missing_columns:
             raise AlgorithmError(f"Missing required columns: {missing_columns}")
         
-        # Basic data cleaning
-        df = transactions.copy()
-        
         # Convert timestamp to datetime if it's not already
-        if not pd.api.types.is_datetime64_any_dtype(df['timestamp']):
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
+        timestamps = transactions['timestamp']
+        converted = not pd.api.types.is_datetime64_any_dtype(timestamps)
+        if converted:
+            timestamps = pd.to_datetime(timestamps)
         
-        # Sort by timestamp
-        df = df.sort_values('timestamp')
+        # Work out which rows survive null removal and their timestamp order
+        # as positions, so the caller's frame is copied exactly once by take()
+        # and never modified
+        valid = (
+            transactions[required_columns].notna().all(axis=1).to_numpy()
+            & timestamps.notna().to_numpy()
+        )
+        positions = np.flatnonzero(valid)
+        positions = positions[timestamps.iloc[positions].argsort(kind='stable').to_numpy()]
         
-        # Remove any rows with null values in required columns
-        df = df.dropna(subset=required_columns)
+        df = transactions.take(positions)
+        if converted:
+            df['timestamp'] = timestamps.iloc[positions].array
         
         return df
     
     def create_result_dataframe(self, transaction_ids: List[str], scores: List[float],
                               confidence_scores: Optional[List[float]] = None,
-                              metadata_list: Optional[List[Dict[str, Any]]] = None) -> pd.DataFrame:
+                              metadata_list: Optional[List[Dict[str, Any]]] = None,
+                              detail_columns: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
         """
         Create standardized result DataFrame.
         
@@ -110,21 +122,32 @@ class AnomalyDetectionAlgorithm(ABC):
             scores: List of anomaly scores
             confidence_scores: Optional list of confidence scores
             metadata_list: Optional list of metadata dictionaries
+            detail_columns: Optional per-transaction columns (name -> values)
+                replacing the metadata column, for algorithms whose details
+                are the same fields on every row
             
         Returns:
             Standardized result DataFrame
         """
         if len(transaction_ids) != len(scores):
             raise AlgorithmError("Length of transaction_ids and scores must match")
+        if metadata_list is not None and detail_columns is not None:
+            raise AlgorithmError("Pass either metadata_list or detail_columns, not both")
         
-        result_df = pd.DataFrame({
+        columns = {
             'transaction_id': transaction_ids,
             'score': scores,
-            'confidence': confidence_scores or [None] * len(transaction_ids),
-            'metadata': metadata_list or [{}] * len(transaction_ids)
-        })
+            'confidence': (
+                confidence_scores if confidence_scores is not None
+                else [None] * len(transaction_ids)
+            )
+        }
+        if detail_columns is not None:
+            columns.update(detail_columns)
+        else:
+            columns['metadata'] = metadata_list or [{}] * len(transaction_ids)
         
-        return result_df
+        return pd.DataFrame(columns)
     
     def validate_input_data(self, transactions: pd.DataFrame) -> None:
         """
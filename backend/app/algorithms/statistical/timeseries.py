@@ -233,8 +233,8 @@ class TimeSeriesAnomalyAlgorithm(StatisticalAlgorithm):
             # Calculate statistics for normal timing patterns
             median_diff = time_diffs.median()
             std_diff = time_diffs.std()
-            q75 = time_diffs.quantile(0.75)
-            q25 = time_diffs.quantile(0.25)
+            # Both quartiles from one quantile call (one sort of the data)
+            q25, q75 = time_diffs.quantile([0.25, 0.75])
             iqr = q75 - q25
             
             # Identify unusual timing patterns
@@ -361,15 +361,15 @@ class TimeSeriesAnomalyAlgorithm(StatisticalAlgorithm):
             upper_threshold = mean_val + threshold_multiplier * std_val
             lower_threshold = max(0, mean_val - threshold_multiplier * std_val)
         elif threshold_method == 'iqr':
-            q75 = adjusted_series.quantile(0.75)
-            q25 = adjusted_series.quantile(0.25)
+            q25, q75 = adjusted_series.quantile([0.25, 0.75])
             iqr = q75 - q25
             upper_threshold = q75 + threshold_multiplier * iqr
             lower_threshold = max(0, q25 - threshold_multiplier * iqr)
         elif threshold_method == 'percentile':
             percentile = threshold_multiplier if threshold_multiplier <= 100 else 95
-            upper_threshold = adjusted_series.quantile(percentile / 100)
-            lower_threshold = adjusted_series.quantile((100 - percentile) / 100)
+            lower_threshold, upper_threshold = adjusted_series.quantile(
+                [(100 - percentile) / 100, percentile / 100]
+            )
         else:
             # Default to standard deviation
             mean_val = adjusted_series.mean()
@@ -1,14 +1,109 @@
 """Z-Score based anomaly detection algorithm."""
 
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Tuple
 import pandas as pd
 import numpy as np
 from scipy import stats
 
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - numba is an optional accelerator
+    njit = None
+    prange = range
+
 from ..base import StatisticalAlgorithm
 from ...utils.exceptions import AlgorithmConfigurationError
 
 
+# Window spreads (sum of squared deviations) below this fraction of the
+# window's sum of squares are rounding noise and are treated as zero variance
+_RELATIVE_VARIANCE_EPS = 1e-12
+
+# Running sums carry a rounding error proportional to the largest sum of
+# squares they have held; once a window's spread falls below this fraction
+# of it, the window is recomputed exactly
+_CANCELLATION_RATIO = 1e-8
+
+
+def _rolling_window_stats_kernel(amounts: np.ndarray, starts: np.ndarray, ends: np.ndarray,
+                                 window_size: int, means: np.ndarray, stds: np.ndarray) -> None:
+    """
+    Fill means/stds with the statistics of the amounts preceding each one.
+    
+    Every ``amounts[starts[g]:ends[g]]`` slice is one series, scanned in a
+    single streaming pass that keeps running sums of x and x² for the
+    sliding window, taken relative to a reference amount. When a large
+    amount has passed through the window the sums no longer resolve the
+    remaining spread; the window is then summed again from scratch around
+    its newest amount. Compiled with numba when it is installed, in which
+    case the series are processed in parallel.
+    """
+    history = window_size - 1
+    
+    for g in prange(starts.shape[0]):
+        start = starts[g]
+        reference = amounts[start] if start < ends[g] else 0.0
+        total = 0.0
+        total_sq = 0.0
+        peak_sq = 0.0
+        
+        for i in range(start, ends[g]):
+            count = min(i - start, history)
+            spread = 0.0
+            if count >= 2:
+                spread = total_sq - total * total / count
+                if spread < _CANCELLATION_RATIO * peak_sq:
+                    reference = amounts[i - 1]
+                    total = 0.0
+                    total_sq = 0.0
+                    for j in range(i - count, i):
+                        current = amounts[j] - reference
+                        total += current
+                        total_sq += current * current
+                    peak_sq = total_sq
+                    spread = total_sq - total * total / count
+            
+            if count >= 1:
+                means[i] = reference + total / count
+            else:
+                means[i] = np.nan
+            if count >= 2:
+                if spread > _RELATIVE_VARIANCE_EPS * total_sq:
+                    stds[i] = np.sqrt(spread / (count - 1))
+                else:
+                    stds[i] = 0.0
+            else:
+                stds[i] = np.nan
+            
+            # Slide the window: add the current amount, drop the oldest one
+            current = amounts[i] - reference
+            total += current
+            total_sq += current * current
+            peak_sq = max(peak_sq, total_sq)
+            if i - start >= history:
+                oldest = amounts[i - history] - reference
+                total -= oldest
+                total_sq -= oldest * oldest
+
+
+if njit is not None:
+    # fastmath is left off: it assumes no NaNs, and the outputs use NaN
+    _rolling_window_stats_kernel = njit(cache=True, parallel=True)(_rolling_window_stats_kernel)
+
+
+# Read-only defaults shared by every instance; partial configs are merged
+# over them instead of rebuilding the default dict on each call
+_DEFAULT_CONFIG = MappingProxyType({
+    "threshold": 3.0,  # Number of standard deviations
+    "window_size": 30,  # Rolling window size for dynamic calculation
+    "min_transactions": 5,  # Minimum transactions needed per account
+    "use_rolling_window": True,  # Use rolling window vs global stats
+    "account_specific": True,  # Calculate stats per account vs globally
+    "absolute_zscore": True,  # Use absolute z-score for anomaly detection
+})
+
+
 class ZScoreAlgorithm(StatisticalAlgorithm):
     """
     Z-Score based anomaly detection algorithm.
@@ -24,22 +119,18 @@ class ZScoreAlgorithm(StatisticalAlgorithm):
     
     def _get_default_config(self) -> Dict[str, Any]:
         """Return default configuration for Z-Score algorithm."""
-        return {
-            "threshold": 3.0,  # Number of standard deviations
-            "window_size": 30,  # Rolling window size for dynamic calculation
-            "min_transactions": 5,  # Minimum transactions needed per account
-            "use_rolling_window": True,  # Use rolling window vs global stats
-            "account_specific": True,  # Calculate stats per account vs globally
-            "absolute_zscore": True,  # Use absolute z-score for anomaly detection
-        }
+        return dict(_DEFAULT_CONFIG)
     
     def validate_config(self, config: Dict[str, Any]) -> bool:
-        """Validate Z-Score algorithm configuration."""
-        required_keys = ["threshold", "window_size", "min_transactions"]
+        """Validate Z-Score algorithm configuration; omitted keys take their defaults."""
+        config = {**_DEFAULT_CONFIG, **config}
         
-        for key in required_keys:
-            if key not in config:
-                raise AlgorithmConfigurationError(f"Missing required config key: {key}")
+        if isinstance(config["threshold"], bool) or not isinstance(config["threshold"], (int, float)):
+            raise AlgorithmConfigurationError("threshold must be a number")
+        
+        for key in ("window_size", "min_transactions"):
+            if isinstance(config[key], bool) or not isinstance(config[key], int):
+                raise AlgorithmConfigurationError(f"{key} must be an integer")
         
         if config["threshold"] <= 0:
             raise AlgorithmConfigurationError("threshold must be positive")
@@ -56,6 +147,24 @@ class ZScoreAlgorithm(StatisticalAlgorithm):
         """Z-Score algorithm needs at least 2 transactions to calculate statistics."""
         return 2
     
+    def prepare_data(self, transactions: pd.DataFrame) -> pd.DataFrame:
+        """
+        Prepare transaction data, storing repeated identifiers as categoricals.
+        
+        Grouping by account then works on integer codes instead of hashing
+        Python strings for every row.
+        """
+        df = super().prepare_data(transactions)
+        
+        if not isinstance(df['account_id'].dtype, pd.CategoricalDtype):
+            df['account_id'] = df['account_id'].astype('category')
+        
+        # Transaction IDs are normally unique; only repeated ones benefit
+        if not isinstance(df['id'].dtype, pd.CategoricalDtype) and df['id'].nunique() < len(df) / 2:
+            df['id'] = df['id'].astype('category')
+        
+        return df
+    
     def detect(self, transactions: pd.DataFrame, config: Dict[str, Any]) -> pd.DataFrame:
         """
         Detect anomalies using Z-Score analysis.
@@ -65,9 +174,12 @@ class ZScoreAlgorithm(StatisticalAlgorithm):
             config: Algorithm configuration
             
         Returns:
-            DataFrame with anomaly scores
+            DataFrame with anomaly scores, the signed z-score and the window
+            statistics (window_mean, window_std, window_size, analysis_type)
+            it was computed from
         """
-        # Validate configuration
+        # Validate configuration, filling omitted keys from the defaults
+        config = {**_DEFAULT_CONFIG, **config}
         self.validate_config(config)
         
         # Validate and prepare data
@@ -78,213 +190,199 @@ class ZScoreAlgorithm(StatisticalAlgorithm):
         threshold = config["threshold"]
         window_size = config["window_size"]
         min_transactions = config["min_transactions"]
-        use_rolling = config.get("use_rolling_window", True)
-        account_specific = config.get("account_specific", True)
-        absolute_zscore = config.get("absolute_zscore", True)
-        
-        results = []
+        use_rolling = config["use_rolling_window"]
+        account_specific = config["account_specific"]
+        absolute_zscore = config["absolute_zscore"]
         
         if account_specific:
-            # Calculate Z-scores per account
-            for account_id in df['account_id'].unique():
-                account_data = df[df['account_id'] == account_id].copy()
-                
-                if len(account_data) < min_transactions:
-                    # Not enough data for this account, skip or use global stats
-                    continue
-                
-                account_results = self._calculate_account_zscores(
-                    account_data, threshold, window_size, use_rolling, absolute_zscore
-                )
-                results.extend(account_results)
+            account_codes, _ = pd.factorize(df['account_id'], sort=False)
         else:
-            # Calculate global Z-scores
-            global_results = self._calculate_global_zscores(
-                df, threshold, window_size, use_rolling, absolute_zscore
-            )
-            results.extend(global_results)
+            account_codes = np.zeros(len(df), dtype=np.intp)
+        
+        # One sort by (account, timestamp) makes every account a contiguous
+        # run; accounts keep their order of first appearance. Timestamps are
+        # keyed as int64 nanoseconds (UTC for tz-aware columns, which would
+        # otherwise come out as an object array of Timestamps)
+        timestamps_ns = df['timestamp'].to_numpy(dtype='datetime64[ns]').view(np.int64)
+        order = np.lexsort((timestamps_ns, account_codes))
+        data = df.iloc[order]
+        account_codes = account_codes[order]
+        # A column taken from a column-major block is a strided view; copy it
+        # into one contiguous run so the window scans walk memory in order
+        amounts = np.ascontiguousarray(data['amount'].to_numpy(), dtype=np.float64)
+        
+        n = len(amounts)
+        starts = np.flatnonzero(np.diff(account_codes, prepend=-1))
+        sizes = np.diff(np.append(starts, n))
         
-        # Create result DataFrame
-        if not results:
-            # Return empty results if no transactions processed
-            return self.create_result_dataframe([], [], [], [])
+        # Accounts below min_transactions are skipped; any series needs 2 points
+        min_size = max(min_transactions if account_specific else 1, 2)
+        rolling_groups = use_rolling & (sizes >= window_size)
         
-        transaction_ids = [r['transaction_id'] for r in results]
-        scores = [r['score'] for r in results]
-        confidences = [r['confidence'] for r in results]
-        metadata_list = [r['metadata'] for r in results]
+        row_starts = np.repeat(starts, sizes)
+        row_sizes = np.repeat(sizes, sizes)
+        rolling_rows = np.repeat(rolling_groups, sizes)
+        keep = row_sizes >= min_size
         
+        # Rolling window statistics over the preceding transactions, or the
+        # whole series' statistics for series shorter than the window
+        means, stds = self._rolling_window_stats(amounts, window_size, starts)
+        series_means, series_stds = self._series_stats(amounts, starts, sizes)
+        means = np.where(rolling_rows, means, np.repeat(series_means, sizes))
+        stds = np.where(rolling_rows, stds, np.repeat(series_stds, sizes))
+        
+        z_scores, confidences = self._score_amounts(
+            amounts[keep], means[keep], stds[keep], threshold, absolute_zscore=False
+        )
+        
+        # Results are built column by column; the reference statistics are
+        # detail columns instead of one metadata dict per transaction
         return self.create_result_dataframe(
-            transaction_ids, scores, confidences, metadata_list
+            data['id'].astype(str).to_numpy()[keep],
+            np.abs(z_scores) if absolute_zscore else z_scores,
+            confidences,
+            detail_columns={
+                'z_score': z_scores,
+                'window_mean': means[keep],
+                'window_std': stds[keep],
+                'window_size': np.where(
+                    rolling_rows, np.minimum(np.arange(n) - row_starts + 1, window_size), row_sizes
+                )[keep],
+                'analysis_type': pd.Categorical.from_codes(
+                    (~rolling_rows[keep]).astype(np.int8), categories=['rolling', 'series']
+                ),
+                'account_id': data['account_id'].to_numpy()[keep]
+            }
         )
     
-    def _calculate_account_zscores(self, account_data: pd.DataFrame, threshold: float,
-                                 window_size: int, use_rolling: bool,
-                                 absolute_zscore: bool) -> list:
-        """Calculate Z-scores for a single account."""
-        results = []
-        
-        account_data = account_data.sort_values('timestamp').copy()
-        amounts = account_data['amount'].values
-        
-        if use_rolling and len(account_data) >= window_size:
-            # Rolling window calculation
-            for i in range(len(account_data)):
-                if i < window_size - 1:
-                    # Not enough history, use what we have
-                    window_amounts = amounts[:i + 1]
-                else:
-                    # Use rolling window
-                    window_amounts = amounts[max(0, i - window_size + 1):i + 1]
-                
-                if len(window_amounts) < 2:
-                    # Need at least 2 data points
-                    z_score = 0.0
-                    confidence = 0.0
-                else:
-                    current_amount = amounts[i]
-                    mean_amount = np.mean(window_amounts[:-1])  # Exclude current transaction
-                    std_amount = np.std(window_amounts[:-1], ddof=1)
-                    
-                    if std_amount == 0:
-                        z_score = 0.0
-                        confidence = 0.0
-                    else:
-                        z_score = (current_amount - mean_amount) / std_amount
-                        if absolute_zscore:
-                            z_score = abs(z_score)
-                        
-                        # Confidence based on how much it exceeds threshold
-                        confidence = min(1.0, abs(z_score) / threshold) if threshold > 0 else 0.0
-                
-                transaction_id = str(account_data.iloc[i]['id'])
-                results.append({
-                    'transaction_id': transaction_id,
-                    'score': float(z_score),
-                    'confidence': float(confidence),
-                    'metadata': {
-                        'mean_amount': float(mean_amount) if 'mean_amount' in locals() else None,
-                        'std_amount': float(std_amount) if 'std_amount' in locals() else None,
-                        'window_size_used': len(window_amounts),
-                        'account_id': account_data.iloc[i]['account_id']
-                    }
-                })
-        else:
-            # Global statistics for the account
-            if len(amounts) < 2:
-                # Not enough data
-                return results
-            
-            mean_amount = np.mean(amounts)
-            std_amount = np.std(amounts, ddof=1)
+    @staticmethod
+    def _rolling_window_stats(amounts: np.ndarray, window_size: int,
+                              starts: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Mean and sample standard deviation of the amounts preceding each transaction.
+        
+        Each transaction is compared with up to ``window_size - 1`` earlier
+        amounts of the same series. With numba installed a compiled streaming
+        kernel is used; otherwise window sums of x and x² are taken as
+        differences of prefix sums, so everything is handled in O(n)
+        vectorized passes. Either way the sums are accumulated relative to a
+        reference amount, windows whose spread has been swamped by the
+        rounding error of an earlier large amount are recomputed exactly,
+        and spreads within rounding noise of zero give a standard deviation
+        of exactly 0.
+        
+        Args:
+            amounts: Transaction amounts, each series in chronological order
+            window_size: Rolling window size, including the current transaction
+            starts: Start offsets of the contiguous series in ``amounts``
+                (defaults to a single series)
             
-            for i, row in account_data.iterrows():
-                current_amount = row['amount']
-                
-                if std_amount == 0:
-                    z_score = 0.0
-                    confidence = 0.0
-                else:
-                    z_score = (current_amount - mean_amount) / std_amount
-                    if absolute_zscore:
-                        z_score = abs(z_score)
-                    
-                    confidence = min(1.0, abs(z_score) / threshold) if threshold > 0 else 0.0
-                
-                transaction_id = str(row['id'])
-                results.append({
-                    'transaction_id': transaction_id,
-                    'score': float(z_score),
-                    'confidence': float(confidence),
-                    'metadata': {
-                        'mean_amount': float(mean_amount),
-                        'std_amount': float(std_amount),
-                        'total_transactions': len(amounts),
-                        'account_id': row['account_id']
-                    }
-                })
-        
-        return results
+        Returns:
+            Tuple of (means, stds); NaN where fewer than one (mean) or two
+            (std) earlier amounts are available
+        """
+        amounts = np.ascontiguousarray(amounts, dtype=np.float64)
+        n = len(amounts)
+        if starts is None:
+            starts = np.zeros(min(n, 1), dtype=np.intp)
+        
+        if njit is not None:
+            means = np.empty(n)
+            stds = np.empty(n)
+            ends = np.append(starts[1:], n)
+            _rolling_window_stats_kernel(amounts, starts, ends, window_size, means, stds)
+            return means, stds
+        
+        # Window before transaction i covers amounts[start[i]:i], never
+        # reaching back into the previous series
+        sizes = np.diff(np.append(starts, n))
+        series_start = np.repeat(starts, sizes)
+        end = np.arange(n)
+        start = np.maximum(end - (window_size - 1), series_start)
+        counts = end - start
+        
+        # Shift every series by its first amount before accumulating
+        reference = amounts[series_start]
+        shifted = amounts - reference
+        prefix = np.concatenate(([0.0], np.cumsum(shifted)))
+        prefix_sq = np.concatenate(([0.0], np.cumsum(shifted * shifted)))
+        total = prefix[end] - prefix[start]
+        total_sq = prefix_sq[end] - prefix_sq[start]
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            means = reference + total / counts
+            spread = total_sq - total * total / counts
+            variances = np.where(spread > _RELATIVE_VARIANCE_EPS * total_sq, spread / (counts - 1), 0.0)
+        
+        # Differences of prefix sums carry the rounding error of everything
+        # accumulated before them; windows whose spread is lost in it are
+        # recomputed exactly
+        redo = np.flatnonzero((counts >= 2) & (spread < _CANCELLATION_RATIO * prefix_sq[end]))
+        block = max(1, (1 << 20) // window_size)
+        offsets = np.arange(window_size - 1)
+        for first in range(0, len(redo), block):
+            rows = redo[first:first + block]
+            window = start[rows, None] + offsets
+            valid = window < end[rows, None]
+            # Two passes over each window, relative to its own first amount
+            values = amounts[np.minimum(window, n - 1)]
+            local_reference = values[:, 0]
+            values = np.where(valid, values - local_reference[:, None], 0.0)
+            local_means = values.sum(axis=1) / counts[rows]
+            deviations = np.where(valid, values - local_means[:, None], 0.0)
+            row_spread = (deviations * deviations).sum(axis=1)
+            scale = (values * values).sum(axis=1)
+            means[rows] = local_reference + local_means
+            variances[rows] = np.where(
+                row_spread > _RELATIVE_VARIANCE_EPS * scale, row_spread / (counts[rows] - 1), 0.0
+            )
+        
+        means = np.where(counts >= 1, means, np.nan)
+        stds = np.where(counts >= 2, np.sqrt(variances), np.nan)
+        
+        return means, stds
     
-    def _calculate_global_zscores(self, df: pd.DataFrame, threshold: float,
-                                window_size: int, use_rolling: bool,
-                                absolute_zscore: bool) -> list:
-        """Calculate Z-scores globally across all transactions."""
-        results = []
-        
-        df = df.sort_values('timestamp').copy()
-        amounts = df['amount'].values
-        
-        if use_rolling and len(df) >= window_size:
-            # Rolling window calculation
-            for i in range(len(df)):
-                if i < window_size - 1:
-                    window_amounts = amounts[:i + 1]
-                else:
-                    window_amounts = amounts[max(0, i - window_size + 1):i + 1]
-                
-                if len(window_amounts) < 2:
-                    z_score = 0.0
-                    confidence = 0.0
-                else:
-                    current_amount = amounts[i]
-                    mean_amount = np.mean(window_amounts[:-1])
-                    std_amount = np.std(window_amounts[:-1], ddof=1)
-                    
-                    if std_amount == 0:
-                        z_score = 0.0
-                        confidence = 0.0
-                    else:
-                        z_score = (current_amount - mean_amount) / std_amount
-                        if absolute_zscore:
-                            z_score = abs(z_score)
-                        
-                        confidence = min(1.0, abs(z_score) / threshold) if threshold > 0 else 0.0
-                
-                transaction_id = str(df.iloc[i]['id'])
-                results.append({
-                    'transaction_id': transaction_id,
-                    'score': float(z_score),
-                    'confidence': float(confidence),
-                    'metadata': {
-                        'mean_amount': float(mean_amount) if 'mean_amount' in locals() else None,
-                        'std_amount': float(std_amount) if 'std_amount' in locals() else None,
-                        'window_size_used': len(window_amounts),
-                        'global_calculation': True
-                    }
-                })
-        else:
-            # Global statistics
-            if len(amounts) < 2:
-                return results
-            
-            mean_amount = np.mean(amounts)
-            std_amount = np.std(amounts, ddof=1)
-            
-            for i, row in df.iterrows():
-                current_amount = row['amount']
-                
-                if std_amount == 0:
-                    z_score = 0.0
-                    confidence = 0.0
-                else:
-                    z_score = (current_amount - mean_amount) / std_amount
-                    if absolute_zscore:
-                        z_score = abs(z_score)
-                    
-                    confidence = min(1.0, abs(z_score) / threshold) if threshold > 0 else 0.0
-                
-                transaction_id = str(row['id'])
-                results.append({
-                    'transaction_id': transaction_id,
-                    'score': float(z_score),
-                    'confidence': float(confidence),
-                    'metadata': {
-                        'mean_amount': float(mean_amount),
-                        'std_amount': float(std_amount),
-                        'total_transactions': len(amounts),
-                        'global_calculation': True
-                    }
-                })
-        
-        return results 
\ No newline at end of file
+    @staticmethod
+    def _series_stats(amounts: np.ndarray, starts: np.ndarray,
+                      sizes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Mean and sample standard deviation of each contiguous series.
+        
+        Returns:
+            Tuple of (means, stds) with one entry per series; std is NaN for
+            series of a single transaction
+        """
+        if len(starts) == 0:
+            return np.empty(0), np.empty(0)
+        
+        means = np.add.reduceat(amounts, starts) / sizes
+        deviations = amounts - np.repeat(means, sizes)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            stds = np.sqrt(np.add.reduceat(deviations * deviations, starts) / (sizes - 1))
+        stds[sizes < 2] = np.nan
+        
+        return means, stds
+    
+    @staticmethod
+    def _score_amounts(amounts: np.ndarray, means: np.ndarray, stds: np.ndarray,
+                       threshold: float, absolute_zscore: bool) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Turn amounts and reference statistics into z-scores and confidences.
+        
+        Transactions without a usable standard deviation (undefined or zero)
+        get a score and confidence of 0.
+        
+        Returns:
+            Tuple of (scores, confidences)
+        """
+        usable = stds > 0  # NaN compares False
+        z_scores = np.zeros(len(amounts))
+        z_scores[usable] = (amounts[usable] - means[usable]) / stds[usable]
+        if absolute_zscore:
+            z_scores = np.abs(z_scores)
+        
+        # Confidence based on how much it exceeds threshold; unusable rows
+        # already have a z-score of 0, so the whole array is clipped at once
+        confidences = np.clip(np.abs(z_scores) / threshold, 0.0, 1.0)
+        
+        return z_scores, confidences
@@ -1,12 +1,13 @@
 """File upload endpoints."""
 
+import codecs
 import os
 import uuid
 from typing import Optional
 
 import aiofiles
 from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..config import get_settings
@@ -17,6 +18,7 @@ from ..schemas.upload import (
     FileUploadResponse,
     FileUploadStats,
     FileUploadStatus,
+    FileUploadStatusBatchRequest,
 )
 from ..services.file_processor import FileProcessorService
 from ..utils.exceptions import FileProcessingError, UnsupportedFileTypeError
@@ -28,6 +30,39 @@ file_processor = FileProcessorService()
 file_validator = FileValidator()
 
 
+# Uploads are copied to disk in chunks of this size
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB
+
+
+# CSV validation only inspects the leading rows, so larger CSV uploads are
+# validated from their first chunk instead of being read back whole
+HEAD_VALIDATED_FILE_TYPES = frozenset({"csv"})
+
+
+async def _read_for_validation(file_path: str, file_type: str, file_size: int) -> bytes:
+    """
+    Read the stored upload, or only its first chunk for head-validated types.
+
+    A head is cut back to its last line break so the validators never see a
+    partial row; UTF-16 text is left uncut since its line breaks span two
+    bytes.
+    """
+    async with aiofiles.open(file_path, "rb") as f:
+        if file_type not in HEAD_VALIDATED_FILE_TYPES or file_size <= UPLOAD_CHUNK_SIZE:
+            return await f.read()
+        head = await f.read(UPLOAD_CHUNK_SIZE)
+
+    if head.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return head
+    return head[:head.rfind(b"\n") + 1] or head
+
+
+def _remove_stored_file(file_path: str) -> None:
+    """Remove a partially or fully stored upload, if present."""
+    if os.path.exists(file_path):
+        os.remove(file_path)
+
+
 @router.post("/upload", response_model=FileUploadResponse)
 async def upload_file(
     file: UploadFile = File(...),
@@ -40,22 +75,55 @@ async def upload_file(
 
     Supports CSV, JSON, Excel, XML, and SIE4 file formats.
     """
-    # Validate file
+    # Reject unsupported types from the multipart headers alone, before any
+    # of the body is read
+    file_type = file_validator.get_file_type_from_filename(file.filename)
+    if file_type is None:
+        raise HTTPException(
+            status_code=400, detail=f"Unsupported file type: {file.filename}"
+        )
+
+    # Generate unique filename
+    file_id = uuid.uuid4()
+    file_extension = os.path.splitext(file.filename)[1]
+    stored_filename = f"{file_id}{file_extension}"
+    file_path = os.path.join(settings.upload_dir, stored_filename)
+
+    # Stream the upload to disk chunk by chunk, rejecting it as soon as it
+    # passes the size limit instead of buffering the whole body first
+    file_size = 0
     try:
-        file_content = await file.read()
-        await file.seek(0)  # Reset file position
+        # Create upload directory if it doesn't exist
+        os.makedirs(settings.upload_dir, exist_ok=True)
 
-        # Basic file validation
-        file_validator.validate_file_size(len(file_content))
-        file_validator.validate_file_type(file.filename)
+        async with aiofiles.open(file_path, "wb") as f:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                file_size += len(chunk)
+                if file_size > file_validator.max_file_size:
+                    max_size_mb = file_validator.max_file_size / (1024 * 1024)
+                    raise HTTPException(
+                        status_code=413,
+                        detail=f"File exceeds maximum allowed size ({max_size_mb:.2f}MB)",
+                    )
+                await f.write(chunk)
+
+    except HTTPException:
+        _remove_stored_file(file_path)
+        raise
+    except Exception as e:
+        _remove_stored_file(file_path)
+        raise HTTPException(status_code=500, detail=f"Upload failed: {str(e)}")
 
-        # Get file type
-        file_type = file_validator.get_file_type(file.filename)
+    # Validate file
+    try:
+        file_content = await _read_for_validation(file_path, file_type, file_size)
 
         # Validate file structure
         validation_result = file_processor.validate_file(
             file_content, file.filename, file_type
         )
+        # Report the stored size, not the size of a validated head
+        validation_result["file_info"]["file_size"] = file_size
 
         if not validation_result.get("valid", False):
             raise HTTPException(
@@ -63,33 +131,23 @@ async def upload_file(
                 detail=f"Invalid file structure: {validation_result.get('error', 'Unknown error')}",
             )
 
-    except UnsupportedFileTypeError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except FileProcessingError as e:
+    except HTTPException:
+        _remove_stored_file(file_path)
+        raise
+    except (UnsupportedFileTypeError, FileProcessingError) as e:
+        _remove_stored_file(file_path)
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
+        _remove_stored_file(file_path)
         raise HTTPException(status_code=500, detail=f"File validation failed: {str(e)}")
 
-    # Generate unique filename
-    file_id = uuid.uuid4()
-    file_extension = os.path.splitext(file.filename)[1]
-    stored_filename = f"{file_id}{file_extension}"
-    file_path = os.path.join(settings.upload_dir, stored_filename)
-
     try:
-        # Create upload directory if it doesn't exist
-        os.makedirs(settings.upload_dir, exist_ok=True)
-
-        # Save file to disk
-        async with aiofiles.open(file_path, "wb") as f:
-            await f.write(file_content)
-
         # Create database record
         upload_record = FileUpload(
             id=file_id,
             filename=stored_filename,
             original_filename=file.filename,
-            file_size=len(file_content),
+            file_size=file_size,
             file_type=file_type,
             mime_type=file.content_type,
             status="uploaded",
@@ -111,8 +169,7 @@ async def upload_file(
 
     except Exception as e:
         # Clean up file if database operation fails
-        if os.path.exists(file_path):
-            os.remove(file_path)
+        _remove_stored_file(file_path)
         raise HTTPException(status_code=500, detail=f"Upload failed: {str(e)}")
 
 
@@ -130,6 +187,26 @@ async def get_upload_status(
     return FileUploadStatus.from_orm(upload)
 
 
+@router.post("/upload/status/batch", response_model=list[FileUploadStatus])
+async def get_upload_status_batch(
+    request: FileUploadStatusBatchRequest, db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Get the status of several file uploads in one request.
+
+    Statuses are returned in the order the IDs were given; unknown IDs are
+    left out.
+    """
+    result = await db.execute(select(FileUpload).where(FileUpload.id.in_(request.ids)))
+    uploads = {upload.id: upload for upload in result.scalars()}
+
+    return [
+        FileUploadStatus.from_orm(uploads[upload_id])
+        for upload_id in dict.fromkeys(request.ids)
+        if upload_id in uploads
+    ]
+
+
 @router.get("/upload/history", response_model=FileUploadListResponse)
 async def get_upload_history(
     page: int = 1,
@@ -147,13 +224,11 @@ async def get_upload_history(
     if status:
         query = query.where(FileUpload.status == status)
 
-    # Count total records
-    count_result = await db.execute(
-        select(FileUpload.id).where(
-            query.whereclause if query.whereclause is not None else True
-        )
-    )
-    total = len(count_result.all())
+    # Count total records in the database instead of fetching every ID
+    count_query = select(func.count()).select_from(FileUpload)
+    if query.whereclause is not None:
+        count_query = count_query.where(query.whereclause)
+    total = (await db.execute(count_query)).scalar_one()
 
     # Get paginated results
     offset = (page - 1) * per_page
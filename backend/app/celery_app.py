@@ -1,6 +1,10 @@
 """Celery application configuration."""
 
+import asyncio
+from typing import Any, Coroutine, Optional
+
 from celery import Celery
+from celery.signals import worker_process_init, worker_process_shutdown
 from .config import get_settings
 
 settings = get_settings()
@@ -46,4 +50,47 @@ celery_app.conf.beat_schedule = {
         "task": "backend.app.tasks.analysis_tasks.cleanup_old_analyses",
         "schedule": 86400.0,  # Every day
     },
-} 
\ No newline at end of file
+} 
+
+
+# Persistent event loop per worker process. Reusing one loop avoids the
+# per-task setup/teardown of asyncio.run() and keeps pooled async database
+# connections bound to a live loop.
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_worker_loop() -> asyncio.AbstractEventLoop:
+    """Return the worker's event loop, creating it on first use."""
+    global _worker_loop
+    if _worker_loop is None or _worker_loop.is_closed():
+        _worker_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_worker_loop)
+    return _worker_loop
+
+
+@worker_process_init.connect
+def _init_worker_loop(**kwargs) -> None:
+    """Create the event loop when a worker process starts."""
+    _get_worker_loop()
+
+
+@worker_process_shutdown.connect
+def _close_worker_loop(**kwargs) -> None:
+    """Close the event loop when a worker process exits."""
+    global _worker_loop
+    if _worker_loop is not None and not _worker_loop.is_closed():
+        _worker_loop.close()
+    _worker_loop = None
+
+
+def run_async(coro: Coroutine[Any, Any, Any]) -> Any:
+    """
+    Run a coroutine to completion on the worker's persistent event loop.
+    
+    Args:
+        coro: Coroutine to run
+        
+    Returns:
+        The coroutine's result
+    """
+    return _get_worker_loop().run_until_complete(coro)
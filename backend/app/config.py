@@ -43,6 +43,9 @@ class Settings(BaseSettings):
     secret_key: str = Field(default="your-secret-key-change-in-production", env="SECRET_KEY")
     algorithm: str = Field(default="HS256", env="ALGORITHM")
     access_token_expire_minutes: int = Field(default=30, env="ACCESS_TOKEN_EXPIRE_MINUTES")
+    # Key for signatures that let trusted producers skip upload content checks;
+    # trusted uploads are disabled while it is unset
+    upload_signing_key: Optional[str] = Field(default=None, env="UPLOAD_SIGNING_KEY")
     
     # Celery settings
     celery_broker_url: str = Field(default="redis://localhost:6379/1", env="CELERY_BROKER_URL")
@@ -1,5 +1,8 @@
 """Database connection and session management."""
 
+from typing import Any
+
+import orjson
 from sqlalchemy import create_engine
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
@@ -10,12 +13,23 @@ from .config import get_settings
 
 settings = get_settings()
 
+
+def json_serializer(obj: Any) -> str:
+    """Serialize JSON/JSONB column values with orjson."""
+    return orjson.dumps(
+        obj,
+        default=str,
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    ).decode()
+
+
 # Create sync engine for migrations and initial setup
 sync_engine = create_engine(
     settings.database_url,
     echo=settings.database_echo,
     pool_pre_ping=True,
     pool_recycle=300,
+    json_serializer=json_serializer,
 )
 
 # Create async engine for API operations
@@ -25,6 +39,7 @@ async_engine = create_async_engine(
     echo=settings.database_echo,
     pool_pre_ping=True,
     pool_recycle=300,
+    json_serializer=json_serializer,
 )
 
 # Session factories
@@ -47,6 +47,11 @@ class FileUploadStatus(BaseModel):
         from_attributes = True
 
 
+class FileUploadStatusBatchRequest(BaseModel):
+    """Schema for batched upload status requests."""
+    ids: list[UUID] = Field(..., max_length=100, description="Upload IDs to look up")
+
+
 class FileUploadListResponse(BaseModel):
     """Schema for paginated file upload list responses."""
     uploads: list[FileUploadResponse]
@@ -2,8 +2,9 @@
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 from datetime import datetime, timezone
+from itertools import islice
 import uuid
 import re
 
@@ -13,6 +14,53 @@ from ..config import get_settings
 
 settings = get_settings()
 
+# Common column name mappings (lower-case alias -> standard name)
+COLUMN_MAPPINGS = {
+    # Amount variations
+    'amount': 'amount',
+    'value': 'amount',
+    'sum': 'amount',
+    'transaction_amount': 'amount',
+    'belopp': 'amount',  # Swedish
+
+    # Timestamp variations
+    'timestamp': 'timestamp',
+    'date': 'timestamp',
+    'transaction_date': 'timestamp',
+    'datum': 'timestamp',  # Swedish
+    'time': 'timestamp',
+    'created_at': 'timestamp',
+
+    # Account ID variations
+    'account_id': 'account_id',
+    'account': 'account_id',
+    'konto': 'account_id',  # Swedish
+    'account_number': 'account_id',
+    'kontonummer': 'account_id',  # Swedish
+
+    # External transaction ID variations
+    'external_transaction_id': 'external_transaction_id',
+    'external_id': 'external_transaction_id',
+    'transaction_id': 'external_transaction_id',
+    'reference': 'external_transaction_id',
+    'referens': 'external_transaction_id',  # Swedish
+}
+
+# Currency symbols and whitespace stripped from string amounts
+CURRENCY_FORMATTING_RE = re.compile(r'[€$£¥₹\s]')
+
+# A comma followed by exactly three trailing digits is a thousands separator
+THOUSANDS_GROUP_RE = re.compile(r',\d{3}$')
+
+# Fields every transaction must have after column standardization
+REQUIRED_FIELDS = ['amount', 'timestamp', 'account_id']
+
+# Nanoseconds per hour, for deriving hour-of-day from epoch values
+NS_PER_HOUR = 3_600_000_000_000
+
+# Timestamp format tried first; most exports use ISO 8601 in UTC
+ISO_UTC_TIMESTAMP_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+
 
 class DataTransformerService:
     """Service for transforming and enriching transaction data."""
@@ -48,117 +96,169 @@ class DataTransformerService:
             # Step 2: Standardize column names
             df = self._standardize_columns(df)
             
-            # Step 3: Validate and clean required fields
-            df = self._validate_required_fields(df)
+            # Steps 3-7: Validate, clean and filter the required fields
+            df = self._clean_batch(df)
             
-            # Step 4: Parse and standardize timestamps
-            df = self._standardize_timestamps(df)
+            # Steps 8-10: Derived fields, metadata and final validation
+            return self._finalize(df, upload_id)
             
-            # Step 5: Clean and validate amounts
-            df = self._clean_amounts(df)
+        except Exception as e:
+            raise DataTransformationError(f"Data transformation failed: {str(e)}")
+    
+    def transform_transactions_chunked(self, raw_transactions: Iterable[Dict[str, Any]],
+                                       upload_id: str, chunk_size: int = 10_000) -> pd.DataFrame:
+        """
+        Transform raw transactions consumed from an iterable in fixed-size chunks.
+        
+        Row-level cleaning runs per chunk and invalid rows are dropped before
+        the chunks are combined, so only one chunk of raw records and its
+        intermediate string columns are alive at a time. ID de-duplication
+        and the per-account derived fields need every row and run once on
+        the combined frame.
+        
+        Args:
+            raw_transactions: Iterable (e.g. a generator) of raw transaction dictionaries
+            upload_id: ID of the upload these transactions belong to
+            chunk_size: Number of records cleaned per chunk
+            
+        Returns:
+            Standardized and enriched transaction DataFrame
+            
+        Raises:
+            DataTransformationError: If transformation fails
+        """
+        try:
+            records = iter(raw_transactions)
+            cleaned = []
+            seen_fields = set()
+            offset = 0
+            
+            while chunk := list(islice(records, chunk_size)):
+                df = pd.DataFrame(chunk, index=pd.RangeIndex(offset, offset + len(chunk)))
+                offset += len(chunk)
+                
+                df = self._standardize_columns(df)
+                seen_fields.update(df.columns)
+                
+                # A chunk whose records all lack a required field only holds
+                # invalid rows; it does not make the whole input invalid
+                missing_field = any(field not in df.columns for field in REQUIRED_FIELDS)
+                if missing_field or df[REQUIRED_FIELDS].isnull().any(axis=1).all():
+                    print(f"Dropping {len(df)} rows with missing required fields")
+                    continue
+                
+                cleaned.append(self._clean_batch(df))
+            
+            if offset == 0:
+                raise DataTransformationError("No transactions to transform")
             
-            # Step 6: Standardize account IDs
-            df = self._standardize_account_ids(df)
+            # A field absent from every chunk is a header problem, not bad rows
+            missing_fields = [field for field in REQUIRED_FIELDS if field not in seen_fields]
+            if missing_fields:
+                raise DataTransformationError(f"Missing required fields: {missing_fields}")
             
-            # Step 7: Add derived fields
-            df = self._add_derived_fields(df)
+            if not cleaned:
+                raise DataTransformationError("No valid transactions after cleaning required fields")
             
-            # Step 8: Add metadata
-            df = self._add_metadata(df, upload_id)
+            df = pd.concat(cleaned)
+            # Chunks carry different account categories; concat falls back to object
+            if not isinstance(df['account_id'].dtype, pd.CategoricalDtype):
+                df['account_id'] = df['account_id'].astype('category')
             
-            # Step 9: Final validation
-            df = self._final_validation(df)
+            df = self._ensure_transaction_ids(df)
             
-            return df
+            return self._finalize(df, upload_id)
             
         except Exception as e:
             raise DataTransformationError(f"Data transformation failed: {str(e)}")
     
+    def _clean_batch(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Validate, clean and filter the required fields of standardized rows."""
+        # Step 3: Validate and clean required fields
+        df = self._validate_required_fields(df)
+        
+        # Step 4: Parse and standardize timestamps
+        df = self._standardize_timestamps(df)
+        
+        # Step 5: Clean and validate amounts
+        df = self._clean_amounts(df)
+        
+        # Step 6: Standardize account IDs
+        df = self._standardize_account_ids(df)
+        
+        # Step 7: Drop rows with missing or unparseable required fields
+        return self._drop_invalid_rows(df)
+    
+    def _finalize(self, df: pd.DataFrame, upload_id: str) -> pd.DataFrame:
+        """Add derived fields and metadata to cleaned rows and validate the result."""
+        # Step 8: Add derived fields
+        df = self._add_derived_fields(df)
+        
+        # Step 9: Add metadata
+        df = self._add_metadata(df, upload_id)
+        
+        # Step 10: Final validation
+        return self._final_validation(df)
+    
     def _ensure_transaction_ids(self, df: pd.DataFrame) -> pd.DataFrame:
         """Ensure all transactions have unique IDs."""
-        if 'id' not in df.columns or df['id'].isnull().any():
-            # Generate UUIDs for missing IDs
-            df['id'] = df.apply(
-                lambda row: str(uuid.uuid4()) if pd.isnull(row.get('id')) else row.get('id'),
-                axis=1
-            )
+        if 'id' not in df.columns:
+            df['id'] = [str(uuid.uuid4()) for _ in range(len(df))]
+        else:
+            # Generate UUIDs for missing IDs in one masked assignment
+            missing = df['id'].isnull()
+            if missing.any():
+                ids = df['id'].astype(object)
+                ids[missing] = [str(uuid.uuid4()) for _ in range(missing.sum())]
+                df['id'] = ids
         
-        # Ensure IDs are unique
-        if df['id'].duplicated().any():
-            duplicate_count = df['id'].duplicated().sum()
-            # Generate new IDs for duplicates
-            mask = df['id'].duplicated(keep='first')
-            df.loc[mask, 'id'] = [str(uuid.uuid4()) for _ in range(mask.sum())]
+        # Ensure IDs are unique: later occurrences get fresh IDs
+        mask = df['id'].duplicated(keep='first')
+        if mask.any():
+            ids = df['id'].astype(object)
+            ids[mask] = [str(uuid.uuid4()) for _ in range(mask.sum())]
+            df['id'] = ids
         
         return df
     
     def _standardize_columns(self, df: pd.DataFrame) -> pd.DataFrame:
         """Standardize column names to expected format."""
-        # Common column name mappings
-        column_mappings = {
-            # Amount variations
-            'amount': 'amount',
-            'value': 'amount',
-            'sum': 'amount',
-            'transaction_amount': 'amount',
-            'belopp': 'amount',  # Swedish
-            
-            # Timestamp variations
-            'timestamp': 'timestamp',
-            'date': 'timestamp',
-            'transaction_date': 'timestamp',
-            'datum': 'timestamp',  # Swedish
-            'time': 'timestamp',
-            'created_at': 'timestamp',
-            
-            # Account ID variations
-            'account_id': 'account_id',
-            'account': 'account_id',
-            'konto': 'account_id',  # Swedish
-            'account_number': 'account_id',
-            'kontonummer': 'account_id',  # Swedish
-            
-            # External transaction ID variations
-            'external_transaction_id': 'external_transaction_id',
-            'external_id': 'external_transaction_id',
-            'transaction_id': 'external_transaction_id',
-            'reference': 'external_transaction_id',
-            'referens': 'external_transaction_id',  # Swedish
-        }
+        # Apply case-insensitive mapping to all column labels at once
+        df.columns = [
+            COLUMN_MAPPINGS.get(str(col).strip().lower(), col) for col in df.columns
+        ]
         
-        # Apply case-insensitive mapping
-        df_columns_lower = {col.lower(): col for col in df.columns}
-        rename_dict = {}
-        
-        for mapping_key, standard_name in column_mappings.items():
-            if mapping_key.lower() in df_columns_lower:
-                original_col = df_columns_lower[mapping_key.lower()]
-                if original_col != standard_name:
-                    rename_dict[original_col] = standard_name
-        
-        if rename_dict:
-            df = df.rename(columns=rename_dict)
+        # Records from different sources may use different aliases for the
+        # same field (e.g. 'amount' in one row, 'belopp' in another); merge
+        # them into one column holding the first non-null value per row
+        if not df.columns.is_unique:
+            merged = {}
+            for name in dict.fromkeys(df.columns):
+                columns = df.loc[:, df.columns == name]
+                merged[name] = columns.bfill(axis=1).iloc[:, 0]
+            df = pd.DataFrame(merged, index=df.index)
         
         return df
     
     def _validate_required_fields(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Validate and clean required fields."""
-        required_fields = ['amount', 'timestamp', 'account_id']
+        """
+        Validate required fields.
         
+        Rows with missing values are only counted here; they are removed
+        together with unparseable values by _drop_invalid_rows.
+        """
         # Check for required fields
-        missing_fields = [field for field in required_fields if field not in df.columns]
+        missing_fields = [field for field in REQUIRED_FIELDS if field not in df.columns]
         if missing_fields:
             raise DataTransformationError(f"Missing required fields: {missing_fields}")
         
-        # Remove rows with null values in required fields
-        initial_count = len(df)
-        df = df.dropna(subset=required_fields)
-        dropped_count = initial_count - len(df)
+        missing_values = df[REQUIRED_FIELDS].isnull().any(axis=1)
+        missing_count = missing_values.sum()
         
-        if dropped_count > 0:
-            print(f"Dropped {dropped_count} rows with missing required fields")
+        if missing_count > 0:
+            print(f"Dropping {missing_count} rows with missing required fields")
         
-        if df.empty:
+        if missing_count == len(df):
             raise DataTransformationError("No valid transactions after cleaning required fields")
         
         return df
@@ -166,15 +266,24 @@ class DataTransformerService:
     def _standardize_timestamps(self, df: pd.DataFrame) -> pd.DataFrame:
         """Parse and standardize timestamp values."""
         try:
-            # Try to parse timestamps with various formats
-            df['timestamp'] = pd.to_datetime(df['timestamp'], errors='coerce', infer_datetime_format=True)
+            # Fast path: fixed-format ISO 8601 UTC ("2023-01-01T10:00:00Z"),
+            # then parse only the rows it missed element by element
+            raw_timestamps = df['timestamp']
+            timestamps = pd.to_datetime(
+                raw_timestamps, format=ISO_UTC_TIMESTAMP_FORMAT, utc=True, errors='coerce'
+            )
+            unparsed = timestamps.isnull() & raw_timestamps.notnull()
+            if unparsed.any():
+                timestamps[unparsed] = pd.to_datetime(
+                    raw_timestamps[unparsed], format='mixed', utc=True, errors='coerce'
+                )
+            df['timestamp'] = timestamps
             
-            # Handle any remaining unparseable timestamps
-            null_timestamps = df['timestamp'].isnull()
+            # Unparseable timestamps are left as NaT and dropped with the other
+            # invalid rows - could be enhanced to use row number or file timestamp
+            null_timestamps = timestamps.isnull() & raw_timestamps.notnull()
             if null_timestamps.any():
                 print(f"Warning: {null_timestamps.sum()} timestamps could not be parsed")
-                # For now, drop these rows - could be enhanced to use row number or file timestamp
-                df = df[~null_timestamps]
             
             # Ensure timezone awareness (assume UTC if naive)
             if df['timestamp'].dt.tz is None:
@@ -190,21 +299,34 @@ class DataTransformerService:
     def _clean_amounts(self, df: pd.DataFrame) -> pd.DataFrame:
         """Clean and validate transaction amounts."""
         try:
-            # Handle string amounts (remove currency symbols, commas, etc.)
+            # Handle string amounts (remove currency symbols, separators, etc.)
             if df['amount'].dtype == 'object':
                 # Remove common currency symbols and formatting
-                df['amount'] = df['amount'].astype(str).str.replace(r'[€$£¥₹,\s]', '', regex=True)
-                # Handle comma as decimal separator (common in Europe)
-                df['amount'] = df['amount'].str.replace(',', '.')
+                amounts = df['amount'].astype(str).str.replace(CURRENCY_FORMATTING_RE, '', regex=True)
+                
+                # Comma is the decimal separator when it comes after the last
+                # dot ("1.234,56"), or is the only separator and is not
+                # followed by a group of three digits ("100,50" but not "2,500")
+                last_comma = amounts.str.rfind(',')
+                last_dot = amounts.str.rfind('.')
+                decimal_comma = (last_comma > last_dot) & (
+                    (last_dot >= 0)
+                    | ((amounts.str.count(',') == 1) & ~amounts.str.contains(THOUSANDS_GROUP_RE))
+                )
+                
+                df['amount'] = amounts.str.replace(',', '', regex=False).where(
+                    ~decimal_comma,
+                    amounts.str.replace('.', '', regex=False).str.replace(',', '.', regex=False)
+                )
             
-            # Convert to numeric
-            df['amount'] = pd.to_numeric(df['amount'], errors='coerce')
+            # Convert to numeric; invalid amounts become NaN and are dropped
+            # with the other invalid rows
+            raw_amounts = df['amount']
+            df['amount'] = pd.to_numeric(raw_amounts, errors='coerce')
             
-            # Remove rows with invalid amounts
-            null_amounts = df['amount'].isnull()
+            null_amounts = df['amount'].isnull() & raw_amounts.notnull()
             if null_amounts.any():
                 print(f"Warning: {null_amounts.sum()} invalid amounts found and will be dropped")
-                df = df[~null_amounts]
             
             # Validate amount ranges (optional - could be configurable)
             if settings.max_transaction_amount:
@@ -220,39 +342,72 @@ class DataTransformerService:
     def _standardize_account_ids(self, df: pd.DataFrame) -> pd.DataFrame:
         """Standardize account ID format."""
         try:
-            # Convert to string and clean
-            df['account_id'] = df['account_id'].astype(str).str.strip()
-            
-            # Remove any leading/trailing whitespace and normalize
-            df['account_id'] = df['account_id'].str.upper()
-            
-            # Validate account ID format (basic validation)
-            invalid_accounts = df['account_id'].isin(['', 'NAN', 'NONE', 'NULL'])
-            if invalid_accounts.any():
-                print(f"Warning: {invalid_accounts.sum()} invalid account IDs found")
-                df = df[~invalid_accounts]
+            # Account IDs repeat across many rows, so the string work (convert,
+            # strip, upper-case) runs once per distinct raw value and is mapped
+            # back through the factorized codes; missing values get code -1,
+            # which picks up the trailing NaN appended to the cleaned values
+            raw_accounts = df['account_id']
+            codes, uniques = pd.factorize(raw_accounts)
+            cleaned = pd.Series(uniques, dtype=object).astype(str).str.strip().str.upper()
+            
+            # Validate account ID format (basic validation); invalid IDs become
+            # missing and are dropped with the other invalid rows
+            invalid_uniques = cleaned.isin(['', 'NAN', 'NONE', 'NULL']).to_numpy()
+            invalid_count = invalid_uniques[codes[codes >= 0]].sum()
+            if invalid_count > 0:
+                print(f"Warning: {invalid_count} invalid account IDs found")
+            
+            values = np.append(cleaned.mask(invalid_uniques).to_numpy(dtype=object), np.nan)
+            account_ids = pd.Series(values[codes], index=df.index)
+            
+            # Few distinct accounts repeat across many rows; categorical codes
+            # keep the column small and make the per-account groupbys cheap
+            df['account_id'] = account_ids.astype('category')
             
             return df
             
         except Exception as e:
             raise DataTransformationError(f"Account ID standardization failed: {str(e)}")
     
+    def _drop_invalid_rows(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Drop rows with a missing or unparseable required field.
+        
+        The cleaning steps leave invalid values as NaN/NaT instead of
+        filtering the frame themselves, so all rows are removed with a
+        single mask here.
+        """
+        valid = df[REQUIRED_FIELDS].notnull().all(axis=1).to_numpy()
+        if not valid.all():
+            df = df.take(np.flatnonzero(valid))
+        
+        return df
+    
     def _add_derived_fields(self, df: pd.DataFrame) -> pd.DataFrame:
         """Add derived fields for analysis."""
         try:
-            # Time-based features
-            df['year'] = df['timestamp'].dt.year
-            df['month'] = df['timestamp'].dt.month
-            df['day'] = df['timestamp'].dt.day
-            df['hour'] = df['timestamp'].dt.hour
-            df['day_of_week'] = df['timestamp'].dt.dayofweek  # 0=Monday, 6=Sunday
-            df['is_weekend'] = df['day_of_week'].isin([5, 6])
+            # Time-based features from integer arithmetic on the UTC epoch
+            # values; timestamps are always UTC after standardization
+            timestamps = df['timestamp'].to_numpy(dtype='datetime64[ns]')
+            days = timestamps.astype('datetime64[D]')
+            months = timestamps.astype('datetime64[M]')
+            # Calendar fields are stored in the narrowest integer type
+            # that holds them
+            df['year'] = (months.astype(np.int64) // 12 + 1970).astype(np.int16)
+            df['month'] = (months.astype(np.int64) % 12 + 1).astype(np.int8)
+            df['day'] = ((days - months.astype('datetime64[D]')).astype(np.int64) + 1).astype(np.int8)
+            df['hour'] = (timestamps.view(np.int64) // NS_PER_HOUR % 24).astype(np.int8)
+            # 1970-01-01 was a Thursday; 0=Monday, 6=Sunday
+            df['day_of_week'] = ((days.astype(np.int64) + 3) % 7).astype(np.int8)
+            df['is_weekend'] = df['day_of_week'] >= 5
             df['is_business_hours'] = df['hour'].between(9, 17)
             
-            # Amount-based features
-            df['amount_abs'] = df['amount'].abs()
-            df['is_debit'] = df['amount'] < 0
-            df['is_credit'] = df['amount'] > 0
+            # Amount-based features straight from the float array, skipping
+            # Series index alignment
+            amounts = df['amount'].to_numpy()
+            df['amount_abs'] = np.abs(amounts)
+            df['is_debit'] = amounts < 0
+            df['is_credit'] = amounts > 0
             
             # Add amount categories for analysis
             df['amount_category'] = pd.cut(
@@ -262,13 +417,15 @@ class DataTransformerService:
                 include_lowest=True
             )
             
-            # Transaction sequence features (per account)
-            df = df.sort_values(['account_id', 'timestamp'])
-            df['transaction_sequence'] = df.groupby('account_id').cumcount() + 1
+            # Transaction sequence features (per account); both are computed
+            # from one groupby so the account grouping is only built once
+            df = df.sort_values(['account_id', 'timestamp'], kind='mergesort')
+            by_account = df.groupby('account_id', observed=True, sort=False)
+            df['transaction_sequence'] = by_account.cumcount() + 1
             
             # Time differences between transactions (per account)
-            df['time_since_prev'] = df.groupby('account_id')['timestamp'].diff()
-            df['time_since_prev_hours'] = df['time_since_prev'].dt.total_seconds() / 3600
+            df['time_since_prev'] = by_account['timestamp'].diff()
+            df['time_since_prev_hours'] = df['time_since_prev'] / pd.Timedelta(hours=1)
             
             return df
             
@@ -278,28 +435,35 @@ class DataTransformerService:
     def _add_metadata(self, df: pd.DataFrame, upload_id: str) -> pd.DataFrame:
         """Add metadata fields."""
         try:
-            df['upload_id'] = upload_id
+            # Same value on every row: one category, one int8 code per row
+            df['upload_id'] = pd.Categorical.from_codes(
+                np.zeros(len(df), dtype=np.int8), categories=[upload_id]
+            )
             df['processed_at'] = datetime.utcnow()
             
-            # Store original raw data as JSON for reference
+            # Store original raw data as JSON for reference. The per-row dicts
+            # come from one to_dict('records') over the frame instead of a
+            # row-wise apply, which boxes every row into a Series first
             if '_source_file' in df.columns:
-                df['raw_data'] = df.apply(
-                    lambda row: {
-                        'source_file': row.get('_source_file'),
-                        'row_number': row.get('_row_number'),
-                        'original_data': {k: v for k, v in row.items() 
-                                        if not k.startswith('_') and k not in ['raw_data']}
-                    },
-                    axis=1
-                )
+                columns = [col for col in df.columns
+                           if not str(col).startswith('_') and col != 'raw_data']
+                row_numbers = df['_row_number'] if '_row_number' in df.columns else [None] * len(df)
+                df['raw_data'] = [
+                    {
+                        'source_file': source_file,
+                        'row_number': row_number,
+                        'original_data': original_data
+                    }
+                    for source_file, row_number, original_data in zip(
+                        df['_source_file'], row_numbers, df[columns].to_dict('records')
+                    )
+                ]
             else:
-                df['raw_data'] = df.apply(
-                    lambda row: {
-                        'original_data': {k: v for k, v in row.items() 
-                                        if k not in ['raw_data']}
-                    },
-                    axis=1
-                )
+                columns = [col for col in df.columns if col != 'raw_data']
+                df['raw_data'] = [
+                    {'original_data': original_data}
+                    for original_data in df[columns].to_dict('records')
+                ]
             
             return df
             
@@ -339,22 +503,37 @@ class DataTransformerService:
     
     def get_transformation_stats(self, original_count: int, final_df: pd.DataFrame) -> Dict[str, Any]:
         """Get statistics about the transformation process."""
+        final_count = len(final_df)
+        date_range = {'start': None, 'end': None}
+        amount_stats = {'min': None, 'max': None, 'mean': None, 'total': None}
+        account_count = 0
+        
+        if final_count > 0:
+            # One float array for all amount statistics; the mean reuses the total
+            amounts = final_df['amount'].to_numpy(dtype=np.float64)
+            total = float(amounts.sum())
+            amount_stats = {
+                'min': float(amounts.min()),
+                'max': float(amounts.max()),
+                'mean': total / final_count,
+                'total': total
+            }
+            
+            timestamps = final_df['timestamp']
+            date_range = {
+                'start': timestamps.min().isoformat(),
+                'end': timestamps.max().isoformat()
+            }
+            account_count = final_df['account_id'].nunique()
+        
         return {
             'original_count': original_count,
-            'final_count': len(final_df),
-            'dropped_count': original_count - len(final_df),
-            'drop_rate': (original_count - len(final_df)) / original_count if original_count > 0 else 0,
-            'date_range': {
-                'start': final_df['timestamp'].min().isoformat() if not final_df.empty else None,
-                'end': final_df['timestamp'].max().isoformat() if not final_df.empty else None
-            },
-            'amount_stats': {
-                'min': float(final_df['amount'].min()) if not final_df.empty else None,
-                'max': float(final_df['amount'].max()) if not final_df.empty else None,
-                'mean': float(final_df['amount'].mean()) if not final_df.empty else None,
-                'total': float(final_df['amount'].sum()) if not final_df.empty else None
-            },
-            'account_count': final_df['account_id'].nunique() if not final_df.empty else 0,
+            'final_count': final_count,
+            'dropped_count': original_count - final_count,
+            'drop_rate': (original_count - final_count) / original_count if original_count > 0 else 0,
+            'date_range': date_range,
+            'amount_stats': amount_stats,
+            'account_count': account_count,
             'features_added': [
                 'year', 'month', 'day', 'hour', 'day_of_week', 'is_weekend',
                 'is_business_hours', 'amount_abs', 'is_debit', 'is_credit',
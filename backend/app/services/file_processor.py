@@ -3,6 +3,7 @@
 import io
 import json
 import csv
+from itertools import islice
 from abc import ABC, abstractmethod
 from typing import Dict, Any, List, Optional, Iterator
 from pathlib import Path
@@ -58,12 +59,30 @@ class CSVParser(FileParser):
     def parse(self, file_content: bytes, filename: str) -> Iterator[Dict[str, Any]]:
         """Parse CSV file content."""
         try:
-            content = file_content.decode(self.encoding)
-            csv_reader = csv.DictReader(io.StringIO(content), delimiter=self.delimiter)
+            # Decode incrementally instead of materializing the whole text
+            content = io.TextIOWrapper(io.BytesIO(file_content), encoding=self.encoding, newline='')
+            csv_reader = csv.reader(content, delimiter=self.delimiter)
             
-            for row_num, row in enumerate(csv_reader, start=1):
+            # Read the header once and zip it against each row; DictReader
+            # builds an intermediate dict per row before we clean it anyway
+            fieldnames = next(csv_reader, None)
+            if fieldnames is None:
+                return
+            width = len(fieldnames)
+            
+            row_num = 0
+            for values in csv_reader:
+                if not values:
+                    continue  # Blank lines are skipped, as DictReader does
+                row_num += 1
+                
+                if len(values) == width:
+                    pairs = zip(fieldnames, values)
+                else:
+                    pairs = self._ragged_row(fieldnames, values).items()
+                
                 # Clean empty values and add row metadata
-                cleaned_row = {k: v.strip() if v else None for k, v in row.items()}
+                cleaned_row = {k: v.strip() if v else None for k, v in pairs}
                 cleaned_row['_row_number'] = row_num
                 cleaned_row['_source_file'] = filename
                 yield cleaned_row
@@ -73,11 +92,22 @@ class CSVParser(FileParser):
         except csv.Error as e:
             raise FileProcessingError(f"CSV parsing error: {str(e)}")
     
+    @staticmethod
+    def _ragged_row(fieldnames: List[str], values: List[str]) -> Dict[Any, Any]:
+        """Map a row whose length differs from the header the way DictReader does."""
+        row = dict(zip(fieldnames, values))
+        if len(values) > len(fieldnames):
+            row[None] = values[len(fieldnames):]
+        else:
+            for key in fieldnames[len(values):]:
+                row[key] = None
+        return row
+    
     def validate_structure(self, file_content: bytes) -> Dict[str, Any]:
         """Validate CSV structure."""
         try:
-            content = file_content.decode(self.encoding)
-            csv_reader = csv.DictReader(io.StringIO(content), delimiter=self.delimiter)
+            content = io.TextIOWrapper(io.BytesIO(file_content), encoding=self.encoding, newline='')
+            csv_reader = csv.DictReader(content, delimiter=self.delimiter)
             
             # Read first few rows to analyze structure
             sample_rows = []
@@ -374,6 +404,26 @@ class FileProcessorService:
         parser = self.get_parser(file_type)
         yield from parser.parse(file_content, filename)
     
+    def parse_file(self, file_content: bytes, filename: str, file_type: str,
+                   max_rows: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Parse file content into a list of transaction dictionaries.
+        
+        Rows are pulled from the parser's generator, so with ``max_rows`` only
+        the requested prefix of the file is parsed.
+        
+        Args:
+            file_content: Raw file content as bytes
+            filename: Original filename
+            file_type: File type
+            max_rows: Optional maximum number of rows to parse
+            
+        Returns:
+            List of transaction dictionaries
+        """
+        parser = self.get_parser(file_type)
+        return list(islice(parser.parse(file_content, filename), max_rows))
+    
     def get_file_info(self, file_content: bytes, filename: str, file_type: str) -> Dict[str, Any]:
         """Get detailed information about the file."""
         validation = self.validate_file(file_content, filename, file_type)
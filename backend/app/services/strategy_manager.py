@@ -327,10 +327,12 @@ class StrategyManagerService:
                 business_hours_ratio = data['is_business_hours'].mean()
                 stats['temporal_patterns']['business_hours_ratio'] = float(business_hours_ratio)
         
-        # Data quality assessment
+        # Data quality assessment; duplicate rows are found by comparing one
+        # 64-bit hash per row instead of every column value
+        row_hashes = pd.util.hash_pandas_object(data, index=False)
         stats['data_quality'] = {
             'completeness': float((data.notna().sum() / len(data)).mean()),
-            'duplicate_rate': float(data.duplicated().mean()),
+            'duplicate_rate': float(row_hashes.duplicated().mean()),
             'missing_critical_fields': []
         }
         
@@ -1,13 +1,12 @@
 """Celery tasks for analysis operations."""
 
-import asyncio
 from datetime import datetime, timedelta
 from typing import Dict, Any, List
 from celery import current_task
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, delete
 
-from ..celery_app import celery_app
+from ..celery_app import celery_app, run_async
 from ..database import get_async_db
 from ..models.analysis import AnalysisRun
 from ..models.transaction import Transaction
@@ -30,7 +29,7 @@ def run_anomaly_detection(self, analysis_run_id: str) -> Dict[str, Any]:
     Returns:
         Analysis results dictionary
     """
-    return asyncio.run(_run_anomaly_detection_async(self, analysis_run_id))
+    return run_async(_run_anomaly_detection_async(self, analysis_run_id))
 
 
 async def _run_anomaly_detection_async(task, analysis_run_id: str) -> Dict[str, Any]:
@@ -336,7 +335,7 @@ def cancel_analysis_run(self, analysis_run_id: str) -> Dict[str, Any]:
     Returns:
         Cancellation results
     """
-    return asyncio.run(_cancel_analysis_run_async(analysis_run_id))
+    return run_async(_cancel_analysis_run_async(analysis_run_id))
 
 
 async def _cancel_analysis_run_async(analysis_run_id: str) -> Dict[str, Any]:
@@ -380,7 +379,7 @@ def cleanup_old_analyses() -> Dict[str, Any]:
     Returns:
         Cleanup results
     """
-    return asyncio.run(_cleanup_old_analyses_async())
+    return run_async(_cleanup_old_analyses_async())
 
 
 async def _cleanup_old_analyses_async() -> Dict[str, Any]:
@@ -429,7 +428,7 @@ def get_analysis_stats() -> Dict[str, Any]:
     Returns:
         Analysis statistics
     """
-    return asyncio.run(_get_analysis_stats_async())
+    return run_async(_get_analysis_stats_async())
 
 
 async def _get_analysis_stats_async() -> Dict[str, Any]:
@@ -489,7 +488,7 @@ def validate_strategy_async(strategy_config: Dict[str, Any],
     Returns:
         Validation results
     """
-    return asyncio.run(_validate_strategy_async_impl(strategy_config, sample_upload_id))
+    return run_async(_validate_strategy_async_impl(strategy_config, sample_upload_id))
 
 
 async def _validate_strategy_async_impl(strategy_config: Dict[str, Any], 
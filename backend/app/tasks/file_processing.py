@@ -1,15 +1,19 @@
 """Celery tasks for file processing operations."""
 
+import gc
 import os
-import asyncio
+import time
+from decimal import Decimal
+from itertools import chain, repeat
 from datetime import datetime, timedelta
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterable, Iterator, List
+import pandas as pd
 from celery import current_task
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete
+from sqlalchemy import select, delete, func
 
-from ..celery_app import celery_app
-from ..database import get_async_db
+from ..celery_app import celery_app, run_async
+from ..database import get_async_db, json_serializer
 from ..models.upload import FileUpload
 from ..models.transaction import Transaction
 from ..services.file_processor import FileProcessorService
@@ -19,6 +23,21 @@ from ..config import get_settings
 
 settings = get_settings()
 
+# Progress updates are a result-backend round trip, so only send one every
+# N batches or every few seconds, whichever comes first.
+PROGRESS_UPDATE_EVERY_BATCHES = 10
+PROGRESS_UPDATE_INTERVAL_SECONDS = 2.0
+
+# Raw records cleaned per chunk while streaming an upload into the transformer
+TRANSFORM_CHUNK_SIZE = 10_000
+
+
+def _count_rows(rows: Iterable[Dict[str, Any]], counter: List[int]) -> Iterator[Dict[str, Any]]:
+    """Yield rows unchanged while tallying them in ``counter[0]``."""
+    for row in rows:
+        counter[0] += 1
+        yield row
+
 
 @celery_app.task(bind=True)
 def process_uploaded_file(self, upload_id: str) -> Dict[str, Any]:
@@ -31,7 +50,7 @@ def process_uploaded_file(self, upload_id: str) -> Dict[str, Any]:
     Returns:
         Processing results dictionary
     """
-    return asyncio.run(_process_uploaded_file_async(self, upload_id))
+    return run_async(_process_uploaded_file_async(self, upload_id))
 
 
 async def _process_uploaded_file_async(task, upload_id: str) -> Dict[str, Any]:
@@ -59,93 +78,133 @@ async def _process_uploaded_file_async(task, upload_id: str) -> Dict[str, Any]:
             
             # Read file from disk
             file_path = os.path.join(settings.upload_dir, upload.filename)
-            if not os.path.exists(file_path):
-                raise FileProcessingError(f"File not found: {file_path}")
             
             task.update_state(state='PROGRESS', meta={'status': 'Parsing file'})
             
             # Parse file
-            with open(file_path, 'rb') as f:
-                file_content = f.read()
-            
-            parsed_data = file_processor.parse_file(
-                file_content, upload.original_filename, upload.file_type
-            )
+            try:
+                with open(file_path, 'rb') as f:
+                    file_content = f.read()
+            except FileNotFoundError as e:
+                raise FileProcessingError(f"File not found: {file_path}") from e
             
-            if not parsed_data or len(parsed_data) == 0:
+            # Stream parsed rows straight into the chunked transformer so only
+            # one chunk of raw records is held at a time
+            parser = file_processor.get_parser(upload.file_type)
+            rows = parser.parse(file_content, upload.original_filename)
+            first_row = next(rows, None)
+            if first_row is None:
                 raise FileProcessingError("No valid data found in file")
             
-            task.update_state(
-                state='PROGRESS', 
-                meta={'status': 'Transforming data', 'records_found': len(parsed_data)}
-            )
+            task.update_state(state='PROGRESS', meta={'status': 'Transforming data'})
             
             # Transform data
-            original_count = len(parsed_data)
-            transactions_df = data_transformer.transform_transactions(
-                parsed_data, str(upload_id)
+            row_count = [0]
+            transactions_df = data_transformer.transform_transactions_chunked(
+                _count_rows(chain([first_row], rows), row_count), str(upload_id),
+                chunk_size=TRANSFORM_CHUNK_SIZE
             )
+            original_count = row_count[0]
+            total_rows = len(transactions_df)
+            
+            # Raw bytes are no longer needed once parsed
+            del file_content, rows
+            gc.collect()
             
             task.update_state(
                 state='PROGRESS', 
                 meta={
                     'status': 'Storing transactions',
                     'original_count': original_count,
-                    'final_count': len(transactions_df)
+                    'final_count': total_rows
                 }
             )
             
             # Store transactions in database
             transactions_stored = 0
             batch_size = 1000
+            batches_since_update = 0
+            last_update_time = time.monotonic()
             
-            for i in range(0, len(transactions_df), batch_size):
-                batch = transactions_df.iloc[i:i + batch_size]
-                
-                # Convert batch to Transaction objects
-                transaction_objects = []
-                for _, row in batch.iterrows():
-                    transaction = Transaction(
-                        id=row['id'],
-                        upload_id=upload_id,
-                        amount=float(row['amount']),
-                        timestamp=row['timestamp'],
-                        account_id=str(row['account_id']),
-                        external_transaction_id=row.get('external_transaction_id'),
-                        raw_data=row['raw_data'],
-                        processed_data={
-                            'year': int(row.get('year', 0)),
-                            'month': int(row.get('month', 0)),
-                            'day': int(row.get('day', 0)),
-                            'hour': int(row.get('hour', 0)),
-                            'day_of_week': int(row.get('day_of_week', 0)),
-                            'is_weekend': bool(row.get('is_weekend', False)),
-                            'is_business_hours': bool(row.get('is_business_hours', False)),
-                            'amount_abs': float(row.get('amount_abs', 0)),
-                            'is_debit': bool(row.get('is_debit', False)),
-                            'is_credit': bool(row.get('is_credit', False)),
-                            'amount_category': str(row.get('amount_category', 'unknown')),
-                            'transaction_sequence': int(row.get('transaction_sequence', 0)),
-                            'time_since_prev_hours': float(row.get('time_since_prev_hours', 0)) if row.get('time_since_prev_hours') else None
-                        }
-                    )
-                    transaction_objects.append(transaction)
-                
-                # Bulk insert batch
-                db.add_all(transaction_objects)
-                await db.commit()
-                
-                transactions_stored += len(transaction_objects)
-                
-                # Update progress
-                progress = (transactions_stored / len(transactions_df)) * 100
+            if db.bind.dialect.name == 'postgresql':
+                # Lock the upload row first: this opens the session's transaction
+                # on the driver connection, so the COPY below joins it and is
+                # undone by the rollback if anything later fails
+                await db.execute(
+                    select(FileUpload.id).where(FileUpload.id == upload_id).with_for_update()
+                )
+                # Bulk load the whole frame with a single COPY statement
+                transactions_stored = await _copy_transactions(db, transactions_df, upload_id)
                 task.update_state(
                     state='PROGRESS',
                     meta={
-                        'status': f'Storing transactions ({transactions_stored}/{len(transactions_df)})',
-                        'progress': progress
+                        'status': f'Storing transactions ({transactions_stored}/{total_rows})',
+                        'progress': 100.0
                     }
                 )
+            else:
+                # NaN -> None once for the whole column instead of per row
+                time_since_prev = transactions_df['time_since_prev_hours']
+                time_since_prev_out = time_since_prev.astype(object).where(time_since_prev.notna(), None)
+                
+                for i in range(0, total_rows, batch_size):
+                    batch = transactions_df.iloc[i:i + batch_size]
+                    batch_time_since_prev = time_since_prev_out.iloc[i:i + batch_size]
+                    
+                    # Convert batch to Transaction objects
+                    transaction_objects = []
+                    for (_, row), time_since_prev_hours in zip(batch.iterrows(), batch_time_since_prev):
+                        transaction = Transaction(
+                            id=row['id'],
+                            upload_id=upload_id,
+                            amount=float(row['amount']),
+                            timestamp=row['timestamp'],
+                            account_id=str(row['account_id']),
+                            external_transaction_id=row.get('external_transaction_id'),
+                            raw_data=row['raw_data'],
+                            processed_data={
+                                'year': int(row.get('year', 0)),
+                                'month': int(row.get('month', 0)),
+                                'day': int(row.get('day', 0)),
+                                'hour': int(row.get('hour', 0)),
+                                'day_of_week': int(row.get('day_of_week', 0)),
+                                'is_weekend': bool(row.get('is_weekend', False)),
+                                'is_business_hours': bool(row.get('is_business_hours', False)),
+                                'amount_abs': float(row.get('amount_abs', 0)),
+                                'is_debit': bool(row.get('is_debit', False)),
+                                'is_credit': bool(row.get('is_credit', False)),
+                                'amount_category': str(row.get('amount_category', 'unknown')),
+                                'transaction_sequence': int(row.get('transaction_sequence', 0)),
+                                'time_since_prev_hours': time_since_prev_hours
+                            }
+                        )
+                        transaction_objects.append(transaction)
+                    
+                    # Bulk insert batch; flushed here, committed once with the upload status
+                    db.add_all(transaction_objects)
+                    await db.flush()
+                    
+                    transactions_stored += len(transaction_objects)
+                    del transaction_objects
+                    batches_since_update += 1
+                    
+                    # Update progress (throttled, but always report the final batch)
+                    now = time.monotonic()
+                    if (
+                        batches_since_update >= PROGRESS_UPDATE_EVERY_BATCHES
+                        or now - last_update_time >= PROGRESS_UPDATE_INTERVAL_SECONDS
+                        or transactions_stored >= total_rows
+                    ):
+                        progress = (transactions_stored / total_rows) * 100
+                        task.update_state(
+                            state='PROGRESS',
+                            meta={
+                                'status': f'Storing transactions ({transactions_stored}/{total_rows})',
+                                'progress': progress
+                            }
+                        )
+                        batches_since_update = 0
+                        last_update_time = now
             
             # Get transformation stats
             transformation_stats = data_transformer.get_transformation_stats(
@@ -171,8 +230,9 @@ async def _process_uploaded_file_async(task, upload_id: str) -> Dict[str, Any]:
             }
             
         except Exception as e:
-            # Update upload with error status
+            # Discard any partially stored transactions, then record the failure
             try:
+                await db.rollback()
                 upload.status = "failed"
                 upload.processed_at = datetime.utcnow()
                 upload.error_message = str(e)
@@ -184,6 +244,76 @@ async def _process_uploaded_file_async(task, upload_id: str) -> Dict[str, Any]:
             raise FileProcessingError(f"File processing failed: {str(e)}")
 
 
+def _build_processed_data(transactions_df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Build the ``processed_data`` payload for every row column-wise."""
+    time_since_prev = transactions_df['time_since_prev_hours']
+    
+    processed = pd.DataFrame({
+        'year': transactions_df['year'].astype('int64'),
+        'month': transactions_df['month'].astype('int64'),
+        'day': transactions_df['day'].astype('int64'),
+        'hour': transactions_df['hour'].astype('int64'),
+        'day_of_week': transactions_df['day_of_week'].astype('int64'),
+        'is_weekend': transactions_df['is_weekend'].astype(bool),
+        'is_business_hours': transactions_df['is_business_hours'].astype(bool),
+        'amount_abs': transactions_df['amount_abs'].astype('float64'),
+        'is_debit': transactions_df['is_debit'].astype(bool),
+        'is_credit': transactions_df['is_credit'].astype(bool),
+        'amount_category': transactions_df['amount_category'].astype(str),
+        'transaction_sequence': transactions_df['transaction_sequence'].astype('int64'),
+        'time_since_prev_hours': time_since_prev.astype(object).where(time_since_prev.notna(), None)
+    })
+    
+    return processed.to_dict('records')
+
+
+async def _copy_transactions(db: AsyncSession, transactions_df: pd.DataFrame, upload_id: str) -> int:
+    """
+    Store transactions with a single PostgreSQL COPY statement.
+    
+    The COPY runs on the session's own asyncpg connection, inside the
+    transaction that is already open there, so it is committed or rolled
+    back together with the upload status.
+    
+    Args:
+        db: Session whose transaction the rows are written in
+        transactions_df: Transformed transaction DataFrame
+        upload_id: ID of the upload the transactions belong to
+        
+    Returns:
+        Number of transactions stored
+    """
+    if 'external_transaction_id' in transactions_df.columns:
+        external_ids = transactions_df['external_transaction_id'].astype(object)
+        external_ids = external_ids.where(external_ids.notna(), None)
+    else:
+        external_ids = [None] * len(transactions_df)
+    
+    records = zip(
+        transactions_df['id'].astype(str),
+        repeat(str(upload_id)),
+        [Decimal(repr(amount)) for amount in transactions_df['amount'].astype(float)],
+        transactions_df['timestamp'].tolist(),
+        transactions_df['account_id'].astype(str),
+        external_ids,
+        [json_serializer(raw) for raw in transactions_df['raw_data']],
+        [json_serializer(processed) for processed in _build_processed_data(transactions_df)]
+    )
+    
+    connection = await db.connection()
+    raw_connection = await connection.get_raw_connection()
+    await raw_connection.driver_connection.copy_records_to_table(
+        Transaction.__tablename__,
+        records=records,
+        columns=[
+            'id', 'upload_id', 'amount', 'timestamp', 'account_id',
+            'external_transaction_id', 'raw_data', 'processed_data'
+        ]
+    )
+    
+    return len(transactions_df)
+
+
 @celery_app.task
 def validate_file_async(file_content: bytes, filename: str, file_type: str) -> Dict[str, Any]:
     """
@@ -232,7 +362,7 @@ def cleanup_old_uploads() -> Dict[str, Any]:
     Returns:
         Cleanup results
     """
-    return asyncio.run(_cleanup_old_uploads_async())
+    return run_async(_cleanup_old_uploads_async())
 
 
 async def _cleanup_old_uploads_async() -> Dict[str, Any]:
@@ -254,9 +384,11 @@ async def _cleanup_old_uploads_async() -> Dict[str, Any]:
                 try:
                     # Delete file from disk
                     file_path = os.path.join(settings.upload_dir, upload.filename)
-                    if os.path.exists(file_path):
+                    try:
                         os.remove(file_path)
                         files_deleted += 1
+                    except FileNotFoundError:
+                        pass
                     
                     # Delete associated transactions
                     await db.execute(
@@ -295,23 +427,26 @@ def get_file_processing_stats() -> Dict[str, Any]:
     Returns:
         Processing statistics
     """
-    return asyncio.run(_get_file_processing_stats_async())
+    return run_async(_get_file_processing_stats_async())
 
 
 async def _get_file_processing_stats_async() -> Dict[str, Any]:
     """Async implementation of stats collection."""
     async for db in get_async_db():
         try:
-            # Get upload statistics
-            all_uploads_result = await db.execute(select(FileUpload))
-            all_uploads = all_uploads_result.scalars().all()
+            # Stream upload rows in chunks instead of materializing the table
+            uploads_stream = await db.stream_scalars(
+                select(FileUpload).execution_options(yield_per=1000)
+            )
             
             # Count by status
             status_counts = {}
+            total_uploads = 0
             total_size = 0
             processing_times = []
             
-            for upload in all_uploads:
+            async for upload in uploads_stream:
+                total_uploads += 1
                 status = upload.status
                 status_counts[status] = status_counts.get(status, 0) + 1
                 total_size += upload.file_size
@@ -322,11 +457,13 @@ async def _get_file_processing_stats_async() -> Dict[str, Any]:
                     processing_times.append(processing_time)
             
             # Get transaction count
-            transactions_result = await db.execute(select(Transaction))
-            total_transactions = len(transactions_result.scalars().all())
+            transactions_result = await db.execute(
+                select(func.count()).select_from(Transaction)
+            )
+            total_transactions = transactions_result.scalar_one()
             
             return {
-                'total_uploads': len(all_uploads),
+                'total_uploads': total_uploads,
                 'status_breakdown': status_counts,
                 'total_file_size_bytes': total_size,
                 'total_transactions_processed': total_transactions,
@@ -1,34 +1,287 @@
 """Data validation utilities for transaction data."""
 
 import re
-from typing import Dict, Any, List, Optional, Tuple
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Any, Callable, List, Optional, Tuple
 from datetime import datetime, date
-from decimal import Decimal, InvalidOperation
+import numpy as np
 import pandas as pd
+from pandas.errors import OutOfBoundsDatetime
 
 from .exceptions import ValidationError
 
 
+# Patterns compiled once at import time
+_ACCOUNT_RE = re.compile(r'^[A-Z0-9]{3,20}$')
+_TX_RE = re.compile(r'^[A-Z0-9\-_]{1,50}$')
+_SUSPICIOUS_DESC = re.compile(r'test|dummy|fake|sample', re.IGNORECASE)
+_TEST_ACCOUNT = re.compile(r'test|demo|example', re.IGNORECASE)
+_AMOUNT_CLEAN = re.compile(r'[^\d.-]')
+
+# str.translate table deleting every ASCII character an amount cannot contain
+_AMOUNT_DELETE = str.maketrans('', '', ''.join(
+    chr(i) for i in range(128) if chr(i) not in '0123456789.-'
+))
+
+
+# Date formats to try for parsing, in priority order
+DATE_FORMATS = (
+    '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%dT%H:%M:%S',
+    '%Y-%m-%dT%H:%M:%SZ',
+    '%Y-%m-%dT%H:%M:%S.%fZ',
+    '%Y-%m-%d',
+    '%d/%m/%Y %H:%M:%S',
+    '%d/%m/%Y',
+    '%m/%d/%Y %H:%M:%S',
+    '%m/%d/%Y'
+)
+
+
+# Strings pandas parses regardless of the format it is given
+_PANDAS_KEYWORDS = ('now', 'today')
+# Timestamps whose fractional seconds strptime's %f accepts
+_STRPTIME_FRACTION = re.compile(r'.*\.\d{1,6}Z')
+
+# Cutoff for the "very old timestamp" warning
+_YEAR_2000 = pd.Timestamp('2000-01-01', tz='UTC')
+
+# Month-first formats overlap with their day-first counterparts, so they are
+# never promoted ahead of them; all other formats are mutually exclusive
+_UNPROMOTABLE_FORMATS = frozenset({'%m/%d/%Y %H:%M:%S', '%m/%d/%Y'})
+_PROMOTE_AFTER_HITS = 16
+
+# Current try order; the format that keeps winning is moved to the front
+_format_order: Tuple[str, ...] = DATE_FORMATS
+_format_hits: Dict[str, int] = {}
+
+
+def _record_format_hit(date_format: str) -> None:
+    """Count a late format match and promote the format once it dominates."""
+    global _format_order
+    
+    hits = _format_hits.get(date_format, 0) + 1
+    if hits < _PROMOTE_AFTER_HITS:
+        _format_hits[date_format] = hits
+        return
+    
+    _format_hits.clear()
+    _format_order = (date_format,) + tuple(f for f in _format_order if f != date_format)
+
+
+@lru_cache(maxsize=4096)
+def _parse_timestamp_cached(value: str) -> Optional[datetime]:
+    """Parse a timestamp string against DATE_FORMATS, memoizing the result."""
+    order = _format_order
+    for i, date_format in enumerate(order):
+        try:
+            parsed = datetime.strptime(value, date_format)
+        except ValueError:
+            continue
+        
+        if i and date_format not in _UNPROMOTABLE_FORMATS:
+            _record_format_hit(date_format)
+        return parsed
+    return None
+
+
+def _identity(value: Any) -> Any:
+    """Return already-parsed datetime values unchanged."""
+    return value
+
+
+# Timestamp parser per exact value type; subclasses are resolved and cached
+# on first sight, unsupported types map to None
+_TIMESTAMP_PARSERS: Dict[type, Optional[Callable[[Any], Optional[datetime]]]] = {
+    str: _parse_timestamp_cached,
+    datetime: _identity,
+    date: _identity,
+    pd.Timestamp: _identity
+}
+
+
+def _timestamp_parser(value_type: type) -> Optional[Callable[[Any], Optional[datetime]]]:
+    """Return the parser for a timestamp value type, or None if unsupported."""
+    try:
+        return _TIMESTAMP_PARSERS[value_type]
+    except KeyError:
+        pass
+    
+    if issubclass(value_type, (datetime, date)):
+        parser = _identity
+    elif issubclass(value_type, str):
+        parser = _parse_timestamp_cached
+    else:
+        parser = None
+    _TIMESTAMP_PARSERS[value_type] = parser
+    return parser
+
+
+def _to_utc_microseconds(value: datetime) -> np.datetime64:
+    """Convert a datetime to a UTC datetime64[us]; naive values are taken as UTC."""
+    timestamp = pd.Timestamp(value)
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.tz_localize('UTC')
+    return timestamp.tz_convert('UTC').tz_localize(None).as_unit('us').to_datetime64()
+
+
+def _parse_timestamp_series(values: pd.Series) -> pd.Series:
+    """
+    Parse a column of timestamps with the same rules as the scalar validator.
+    
+    Datetime values are converted as they are. Strings are matched against
+    each of DATE_FORMATS in priority order, one vectorized pass per format
+    over the values still unparsed; any string left over goes through the
+    scalar format loop. Values of any other type are unparseable. The
+    result has microsecond resolution, so every year the scalar path
+    accepts (1-9999) is representable.
+    
+    Args:
+        values: Series of timestamp strings or datetime objects
+        
+    Returns:
+        UTC datetime Series with NaT for unparseable values
+    """
+    if pd.api.types.is_datetime64_any_dtype(values.dtype):
+        return pd.to_datetime(values, utc=True)
+    
+    raw = values.to_numpy(dtype=object)
+    parsers = np.array([_timestamp_parser(type(value)) for value in raw], dtype=object)
+    parsed = np.full(len(raw), np.datetime64('NaT'), dtype='datetime64[us]')
+    
+    # pandas parses in nanoseconds; values outside its range (about
+    # 1677-2262) come back NaT and are converted one by one below
+    leftover = []
+    is_datetime = np.flatnonzero(parsers == _identity)
+    if len(is_datetime):
+        converted = pd.to_datetime(pd.Series(raw[is_datetime]), errors='coerce', utc=True)
+        hit = converted.notna().to_numpy()
+        parsed[is_datetime[hit]] = converted[hit].to_numpy(dtype='datetime64[us]')
+        leftover.append(is_datetime[~hit])
+    
+    is_string = parsers == _parse_timestamp_cached
+    # pandas resolves these keywords under any format; strptime never does
+    is_string &= ~pd.Series(raw).isin(_PANDAS_KEYWORDS).to_numpy()
+    pending = np.flatnonzero(is_string)
+    for date_format in DATE_FORMATS:
+        if not len(pending):
+            break
+        strings = pd.Series(raw[pending])
+        converted = pd.to_datetime(strings, format=date_format, errors='coerce', utc=True)
+        hit = converted.notna().to_numpy()
+        if '%f' in date_format:
+            # pandas takes up to nine fractional digits, strptime only six
+            hit &= strings.str.fullmatch(_STRPTIME_FRACTION).to_numpy()
+        parsed[pending[hit]] = converted[hit].to_numpy(dtype='datetime64[us]')
+        pending = pending[~hit]
+    leftover.append(pending)
+    
+    for i in np.concatenate(leftover):
+        value = raw[i]
+        if isinstance(value, str):
+            value = _parse_timestamp_cached(value)
+        if value is not None:
+            try:
+                parsed[i] = _to_utc_microseconds(value)
+            except (OutOfBoundsDatetime, OverflowError, ValueError):
+                continue
+    
+    return pd.Series(parsed, index=values.index).dt.tz_localize('UTC')
+
+
+def _clean_amount(text: str) -> str:
+    """Strip currency symbols, separators and spaces from an amount string."""
+    if text.isascii():
+        return text.translate(_AMOUNT_DELETE)
+    # Non-ASCII input (e.g. '€') needs the Unicode-aware pattern
+    return _AMOUNT_CLEAN.sub('', text)
+
+
+# Amounts far beyond any Numeric(15, 2) value are rejected as malformed
+# instead of being expanded into huge integers
+_MAX_FIXED_POINT_DIGITS = 1000
+
+
+def _parse_fixed_point(text: str) -> Optional[Tuple[int, int]]:
+    """
+    Parse a decimal number into an exact integer representation.
+    
+    Accepts an optional sign, digits with at most one decimal point and an
+    optional exponent, i.e. the plain numbers ``Decimal`` accepts.
+    
+    Args:
+        text: Number as text, e.g. '-123.45' or '1e-05'
+        
+    Returns:
+        Tuple (units, places) with value == units * 10 ** -places, or None
+        if the text is not a number or has more than _MAX_FIXED_POINT_DIGITS
+        digits or exponent magnitude
+    """
+    mantissa, has_exponent, exponent = text.lower().partition('e')
+    sign = 1
+    if mantissa and mantissa[0] in '+-':
+        sign = -1 if mantissa[0] == '-' else 1
+        mantissa = mantissa[1:]
+    
+    whole, _, frac = mantissa.partition('.')
+    digits = whole + frac
+    if not digits.isdecimal() or len(digits) > _MAX_FIXED_POINT_DIGITS:
+        return None
+    
+    places = len(frac)
+    if has_exponent:
+        # Checked as text so an absurd exponent is never converted or raised to
+        if len(exponent.lstrip('+-')) > len(str(_MAX_FIXED_POINT_DIGITS)):
+            return None
+        try:
+            shift = int(exponent)
+        except ValueError:
+            return None
+        if abs(shift) > _MAX_FIXED_POINT_DIGITS:
+            return None
+        places -= shift
+    
+    units = sign * int(digits)
+    if places < 0:
+        units *= 10 ** -places
+        places = 0
+    
+    return units, places
+
+
+def _amount_stats(values: np.ndarray) -> Dict[str, Any]:
+    """
+    Compute the amount statistics used by the quality checks in one pass.
+    
+    The NaN mask is built once and the remaining aggregates run over the
+    already-filtered contiguous array.
+    
+    Args:
+        values: Float array of amounts with NaN for unparseable values
+        
+    Returns:
+        Dictionary with negative/missing counts and min, max and sum
+    """
+    missing = np.isnan(values)
+    present = values[~missing]
+    
+    return {
+        'negative_count': int(np.count_nonzero(present < 0)),
+        'missing_count': int(np.count_nonzero(missing)),
+        'min': float(present.min()) if present.size else None,
+        'max': float(present.max()) if present.size else None,
+        'sum': float(present.sum())
+    }
+
+
 class TransactionDataValidator:
     """Validator for transaction data quality and consistency."""
     
     def __init__(self):
         # Common patterns for validation
-        self.account_id_pattern = re.compile(r'^[A-Z0-9]{3,20}$')
-        self.transaction_id_pattern = re.compile(r'^[A-Z0-9\-_]{1,50}$')
-        
-        # Date formats to try for parsing
-        self.date_formats = [
-            '%Y-%m-%d %H:%M:%S',
-            '%Y-%m-%dT%H:%M:%S',
-            '%Y-%m-%dT%H:%M:%SZ',
-            '%Y-%m-%dT%H:%M:%S.%fZ',
-            '%Y-%m-%d',
-            '%d/%m/%Y %H:%M:%S',
-            '%d/%m/%Y',
-            '%m/%d/%Y %H:%M:%S',
-            '%m/%d/%Y'
-        ]
+        self.account_id_pattern = _ACCOUNT_RE
+        self.transaction_id_pattern = _TX_RE
     
     def validate_transaction_batch(self, transactions: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -56,39 +309,208 @@ class TransactionDataValidator:
             result['errors'].append("No transactions provided")
             return result
         
-        # Validate each transaction
+        # Validate each transaction against a single reference time
+        now = datetime.now()
+        error_mask = np.zeros(len(transactions), dtype=np.uint8)
+        row_errors: Dict[int, List[str]] = {}
+        row_warnings: Dict[int, List[str]] = {}
         for i, transaction in enumerate(transactions):
-            tx_errors = self.validate_single_transaction(transaction)
+            tx_errors = self.validate_single_transaction(transaction, now=now)
             
             if tx_errors['errors']:
-                result['invalid_transactions'] += 1
+                error_mask[i] = 1
                 result['transaction_errors'][i] = tx_errors
-                result['errors'].extend([f"Transaction {i}: {err}" for err in tx_errors['errors']])
-            else:
-                result['valid_transactions'] += 1
+                row_errors[i] = tx_errors['errors']
             
             if tx_errors['warnings']:
-                result['warnings'].extend([f"Transaction {i}: {warn}" for warn in tx_errors['warnings']])
+                row_warnings[i] = tx_errors['warnings']
+        
+        result['invalid_transactions'] = int(np.count_nonzero(error_mask))
+        result['valid_transactions'] = len(transactions) - result['invalid_transactions']
         
         # Batch-level validation
         batch_validation = self._validate_batch_consistency(transactions)
-        result['errors'].extend(batch_validation['errors'])
-        result['warnings'].extend(batch_validation['warnings'])
+        result['errors'] = self._format_row_messages(row_errors) + batch_validation['errors']
+        result['warnings'] = self._format_row_messages(row_warnings) + batch_validation['warnings']
         
         # Overall validity
-        result['valid'] = len(result['errors']) == 0
+        result['valid'] = not error_mask.any() and not batch_validation['errors']
         
         # Create summary
         result['summary'] = self._create_validation_summary(transactions, result)
         
         return result
     
-    def validate_single_transaction(self, transaction: Dict[str, Any]) -> Dict[str, Any]:
+    def validate_transaction_batch_vectorized(self, transactions: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Validate a batch of transactions column-wise.
+        
+        Returns the same structure as ``validate_transaction_batch`` but runs
+        the per-field checks as pandas/numpy operations over the whole batch
+        instead of one Python call per transaction.
+        
+        Args:
+            transactions: List of transaction dictionaries
+            
+        Returns:
+            Validation result with errors and warnings
+        """
+        result = {
+            'valid': True,
+            'total_transactions': len(transactions),
+            'valid_transactions': 0,
+            'invalid_transactions': 0,
+            'errors': [],
+            'warnings': [],
+            'transaction_errors': {},
+            'summary': {}
+        }
+        
+        if not transactions:
+            result['valid'] = False
+            result['errors'].append("No transactions provided")
+            return result
+        
+        df = pd.DataFrame.from_records(transactions)
+        row_errors: Dict[int, List[str]] = {}
+        row_warnings: Dict[int, List[str]] = {}
+        
+        def flag(target: Dict[int, List[str]], mask: np.ndarray, message) -> None:
+            for i in np.flatnonzero(mask):
+                i = int(i)
+                target.setdefault(i, []).append(message(i) if callable(message) else message)
+        
+        # Required fields
+        required_fields = ['amount', 'timestamp', 'account_id']
+        missing_required = np.zeros(len(df), dtype=bool)
+        for field in required_fields:
+            if field not in df.columns:
+                df[field] = None
+            null_mask = df[field].isna().to_numpy()
+            flag(
+                row_errors, null_mask,
+                lambda i, field=field: (
+                    f"Missing required field: {field}" if field not in transactions[i]
+                    else f"Required field '{field}' is null"
+                )
+            )
+            missing_required |= null_mask
+        checked = ~missing_required
+        
+        # Amounts: numeric values directly, strings after stripping symbols
+        amount_raw = df['amount']
+        amount = pd.to_numeric(amount_raw, errors='coerce')
+        unparsed = amount.isna() & amount_raw.notna()
+        if unparsed.any():
+            cleaned = amount_raw[unparsed].astype(str).map(_clean_amount)
+            amount[unparsed] = pd.to_numeric(cleaned, errors='coerce')
+        amount_values = amount.to_numpy(dtype=float)
+        amount_ok = np.isfinite(amount_values)
+        flag(row_errors, checked & ~amount_ok,
+             lambda i: f"Invalid amount format: {transactions[i]['amount']}")
+        
+        amount_checked = checked & amount_ok
+        flag(row_warnings, amount_checked & (amount_values == 0), "Zero amount transaction")
+        flag(row_warnings, amount_checked & (amount_values < 0), "Negative amount transaction")
+        flag(row_warnings, amount_checked & (amount_values > 1000000), "Very large amount transaction")
+        with np.errstate(invalid='ignore'):
+            too_precise = np.round(amount_values, 2) != amount_values
+        flag(row_warnings, amount_checked & too_precise, "Amount has more than 2 decimal places")
+        
+        # Timestamps
+        timestamps = _parse_timestamp_series(df['timestamp'])
+        timestamp_ok = timestamps.notna().to_numpy()
+        flag(row_errors, checked & ~timestamp_ok,
+             lambda i: self._timestamp_error(transactions[i]['timestamp']))
+        
+        timestamp_checked = checked & timestamp_ok
+        # Range checks (NaT compares False and is masked out anyway)
+        is_future = (timestamps > pd.Timestamp.now(tz='UTC')).to_numpy()
+        flag(row_warnings, timestamp_checked & is_future, "Future timestamp detected")
+        flag(row_warnings, timestamp_checked & ~is_future & (timestamps < _YEAR_2000).to_numpy(),
+             "Very old timestamp detected")
+        
+        # Account IDs
+        accounts = df['account_id'].astype(str).str.strip()
+        account_lengths = accounts.str.len().to_numpy()
+        flag(row_errors, checked & (account_lengths == 0), "Account ID cannot be empty")
+        flag(row_warnings, checked & (account_lengths > 0) & (account_lengths < 3),
+             "Account ID is very short")
+        flag(row_warnings, checked & (account_lengths > 50), "Account ID is very long")
+        flag(row_warnings, checked & accounts.str.fullmatch(_TEST_ACCOUNT).to_numpy(),
+             "Account ID appears to be a test account")
+        
+        # Optional fields
+        tx_ids = pd.Series(
+            [tx.get('id') or tx.get('transaction_id') for tx in transactions], dtype='string'
+        )
+        present = tx_ids.notna().to_numpy()
+        stripped_ids = tx_ids.str.strip()
+        flag(row_warnings, checked & present & (stripped_ids == '').to_numpy(na_value=False),
+             "Empty transaction ID")
+        flag(row_warnings, checked & present & (stripped_ids.str.len() > 100).to_numpy(na_value=False),
+             "Transaction ID is very long")
+        
+        if 'description' in df.columns:
+            present = df['description'].notna().to_numpy()
+            descriptions = df['description'].astype(str).str.strip()
+            flag(row_warnings, checked & present & (descriptions == '').to_numpy(), "Empty description")
+            flag(row_warnings, checked & present & (descriptions.str.len() > 1000).to_numpy(),
+                 "Very long description")
+            suspicious = descriptions.str.contains(_SUSPICIOUS_DESC)
+            flag(row_warnings, checked & present & suspicious.to_numpy(),
+                 "Description contains test-like content")
+        
+        # Aggregate per-row findings
+        row_errors = dict(sorted(row_errors.items()))
+        row_warnings = dict(sorted(row_warnings.items()))
+        for i, errors in row_errors.items():
+            result['transaction_errors'][i] = {
+                'errors': errors,
+                'warnings': row_warnings.get(i, [])
+            }
+        
+        result['invalid_transactions'] = len(row_errors)
+        result['valid_transactions'] = len(transactions) - len(row_errors)
+        
+        # Batch-level validation
+        batch_validation = self._validate_batch_consistency(
+            transactions, tx_ids=tx_ids, timestamps=timestamps
+        )
+        result['errors'] = self._format_row_messages(row_errors) + batch_validation['errors']
+        result['warnings'] = self._format_row_messages(row_warnings) + batch_validation['warnings']
+        
+        result['valid'] = not row_errors and not batch_validation['errors']
+        result['summary'] = self._create_validation_summary(
+            transactions, result, account_ids=df['account_id'].astype('string')
+        )
+        
+        return result
+    
+    @staticmethod
+    def _timestamp_error(timestamp: Any) -> str:
+        """Error message for an unparseable timestamp, as the scalar path words it."""
+        if _timestamp_parser(type(timestamp)) is None:
+            return f"Unsupported timestamp type: {type(timestamp)}"
+        return f"Invalid timestamp format: {timestamp}"
+    
+    @staticmethod
+    def _format_row_messages(row_messages: Dict[int, List[str]]) -> List[str]:
+        """Prefix per-transaction messages with their index, in one pass."""
+        return [
+            f"Transaction {i}: {message}"
+            for i, messages in row_messages.items()
+            for message in messages
+        ]
+    
+    def validate_single_transaction(self, transaction: Dict[str, Any],
+                                    now: Optional[datetime] = None) -> Dict[str, Any]:
         """
         Validate a single transaction.
         
         Args:
             transaction: Transaction dictionary
+            now: Reference time for date range checks (defaults to current time)
             
         Returns:
             Validation result for the transaction
@@ -114,7 +536,7 @@ class TransactionDataValidator:
         warnings.extend(amount_validation['warnings'])
         
         # Timestamp validation
-        timestamp_validation = self._validate_timestamp(transaction.get('timestamp'))
+        timestamp_validation = self._validate_timestamp(transaction.get('timestamp'), now=now)
         errors.extend(timestamp_validation['errors'])
         warnings.extend(timestamp_validation['warnings'])
         
@@ -146,33 +568,34 @@ class TransactionDataValidator:
             errors.append("Amount cannot be null")
             return {'errors': errors, 'warnings': warnings}
         
-        # Try to convert to Decimal for precise validation
-        try:
-            if isinstance(amount, str):
-                # Remove currency symbols and spaces
-                cleaned_amount = re.sub(r'[^\d.-]', '', amount)
-                decimal_amount = Decimal(cleaned_amount)
-            else:
-                decimal_amount = Decimal(str(amount))
-            
-            # Validate amount constraints
-            if decimal_amount == 0:
-                warnings.append("Zero amount transaction")
-            elif decimal_amount < 0:
-                warnings.append("Negative amount transaction")
-            elif decimal_amount > Decimal('1000000'):  # 1 million
-                warnings.append("Very large amount transaction")
-            
-            # Check decimal places
-            if decimal_amount.as_tuple().exponent < -2:
-                warnings.append("Amount has more than 2 decimal places")
-                
-        except (InvalidOperation, ValueError, TypeError):
+        # Parse into exact integer units so the checks below are integer comparisons
+        if isinstance(amount, str):
+            # Remove currency symbols and spaces
+            parsed = _parse_fixed_point(_clean_amount(amount))
+        else:
+            parsed = _parse_fixed_point(str(amount))
+        
+        if parsed is None:
             errors.append(f"Invalid amount format: {amount}")
+            return {'errors': errors, 'warnings': warnings}
+        
+        units, places = parsed
+        
+        # Validate amount constraints
+        if units == 0:
+            warnings.append("Zero amount transaction")
+        elif units < 0:
+            warnings.append("Negative amount transaction")
+        elif units > 1_000_000 * 10 ** places:  # 1 million
+            warnings.append("Very large amount transaction")
+        
+        # Check decimal places
+        if places > 2:
+            warnings.append("Amount has more than 2 decimal places")
         
         return {'errors': errors, 'warnings': warnings}
     
-    def _validate_timestamp(self, timestamp: Any) -> Dict[str, List[str]]:
+    def _validate_timestamp(self, timestamp: Any, now: Optional[datetime] = None) -> Dict[str, List[str]]:
         """Validate transaction timestamp."""
         errors = []
         warnings = []
@@ -181,29 +604,19 @@ class TransactionDataValidator:
             errors.append("Timestamp cannot be null")
             return {'errors': errors, 'warnings': warnings}
         
-        parsed_date = None
-        
-        # If already a datetime object
-        if isinstance(timestamp, (datetime, date)):
-            parsed_date = timestamp
-        elif isinstance(timestamp, str):
-            # Try to parse string timestamp
-            for date_format in self.date_formats:
-                try:
-                    parsed_date = datetime.strptime(timestamp, date_format)
-                    break
-                except ValueError:
-                    continue
-            
-            if parsed_date is None:
-                errors.append(f"Invalid timestamp format: {timestamp}")
-                return {'errors': errors, 'warnings': warnings}
-        else:
+        # Dispatch on the value type: datetimes pass through, strings are parsed
+        parser = _timestamp_parser(type(timestamp))
+        if parser is None:
             errors.append(f"Unsupported timestamp type: {type(timestamp)}")
             return {'errors': errors, 'warnings': warnings}
         
+        parsed_date = parser(timestamp)
+        if parsed_date is None:
+            errors.append(f"Invalid timestamp format: {timestamp}")
+            return {'errors': errors, 'warnings': warnings}
+        
         # Validate date range
-        current_date = datetime.now()
+        current_date = now or datetime.now()
         if parsed_date > current_date:
             warnings.append("Future timestamp detected")
         elif parsed_date.year < 2000:
@@ -230,7 +643,7 @@ class TransactionDataValidator:
             warnings.append("Account ID is very long")
         
         # Check for suspicious patterns
-        if account_str.lower() in ['test', 'demo', 'example']:
+        if _TEST_ACCOUNT.fullmatch(account_str):
             warnings.append("Account ID appears to be a test account")
         
         return {'errors': errors, 'warnings': warnings}
@@ -267,14 +680,27 @@ class TransactionDataValidator:
             warnings.append("Very long description")
         
         # Check for suspicious content
-        suspicious_words = ['test', 'dummy', 'fake', 'sample']
-        if any(word in desc_str.lower() for word in suspicious_words):
+        if _SUSPICIOUS_DESC.search(desc_str):
             warnings.append("Description contains test-like content")
         
         return {'warnings': warnings}
     
-    def _validate_batch_consistency(self, transactions: List[Dict[str, Any]]) -> Dict[str, List[str]]:
-        """Validate consistency across the batch of transactions."""
+    def _validate_batch_consistency(self, transactions: List[Dict[str, Any]],
+                                    tx_ids: Optional[pd.Series] = None,
+                                    timestamps: Optional[pd.Series] = None) -> Dict[str, List[str]]:
+        """
+        Validate consistency across the batch of transactions.
+        
+        Args:
+            transactions: List of transaction dictionaries
+            tx_ids: Optional string Series of transaction IDs already extracted
+                by the vectorized path, used for the duplicate check
+            timestamps: Optional parsed datetime Series from the vectorized
+                path, used for the ordering check
+            
+        Returns:
+            Batch-level errors and warnings
+        """
         errors = []
         warnings = []
         
@@ -282,29 +708,38 @@ class TransactionDataValidator:
             return {'errors': errors, 'warnings': warnings}
         
         # Check for duplicate transaction IDs
-        tx_ids = []
-        for tx in transactions:
-            tx_id = tx.get('id') or tx.get('transaction_id')
-            if tx_id:
-                tx_ids.append(str(tx_id))
-        
-        if len(tx_ids) != len(set(tx_ids)):
-            errors.append("Duplicate transaction IDs detected")
+        if tx_ids is not None:
+            non_empty = tx_ids.dropna()
+            if non_empty[non_empty != ''].duplicated().any():
+                errors.append("Duplicate transaction IDs detected")
+        else:
+            ids = []
+            for tx in transactions:
+                tx_id = tx.get('id') or tx.get('transaction_id')
+                if tx_id:
+                    ids.append(str(tx_id))
+            
+            if len(ids) != len(set(ids)):
+                errors.append("Duplicate transaction IDs detected")
         
         # Check timestamp ordering
-        timestamps = []
-        for tx in transactions:
-            if 'timestamp' in tx:
-                try:
-                    parsed_ts = self._parse_timestamp(tx['timestamp'])
-                    if parsed_ts:
-                        timestamps.append(parsed_ts)
-                except:
-                    continue
-        
-        if len(timestamps) > 1:
-            if timestamps != sorted(timestamps):
+        if timestamps is not None:
+            if not timestamps.dropna().is_monotonic_increasing:
                 warnings.append("Transactions are not chronologically ordered")
+        else:
+            parsed = []
+            for tx in transactions:
+                if 'timestamp' in tx:
+                    try:
+                        parsed_ts = self._parse_timestamp(tx['timestamp'])
+                        if parsed_ts:
+                            parsed.append(parsed_ts)
+                    except:
+                        continue
+            
+            if len(parsed) > 1:
+                if parsed != sorted(parsed):
+                    warnings.append("Transactions are not chronologically ordered")
         
         # Check for account diversity
         accounts = set()
@@ -319,19 +754,25 @@ class TransactionDataValidator:
     
     def _parse_timestamp(self, timestamp: Any) -> Optional[datetime]:
         """Helper to parse timestamp."""
-        if isinstance(timestamp, (datetime, date)):
-            return timestamp
-        elif isinstance(timestamp, str):
-            for date_format in self.date_formats:
-                try:
-                    return datetime.strptime(timestamp, date_format)
-                except ValueError:
-                    continue
-        return None
+        parser = _timestamp_parser(type(timestamp))
+        return parser(timestamp) if parser else None
     
     def _create_validation_summary(self, transactions: List[Dict[str, Any]], 
-                                 result: Dict[str, Any]) -> Dict[str, Any]:
-        """Create validation summary statistics."""
+                                 result: Dict[str, Any],
+                                 account_ids: Optional[pd.Series] = None) -> Dict[str, Any]:
+        """
+        Create validation summary statistics.
+        
+        Args:
+            transactions: List of transaction dictionaries
+            result: Batch validation result with counts and messages
+            account_ids: Optional string Series of account IDs from the
+                vectorized path; unique accounts are then counted by pandas
+                instead of a Python set
+            
+        Returns:
+            Summary statistics
+        """
         summary = {
             'total_transactions': len(transactions),
             'valid_transactions': result['valid_transactions'],
@@ -341,50 +782,93 @@ class TransactionDataValidator:
             'warning_count': len(result['warnings'])
         }
         
-        # Analyze data characteristics
+        # Analyze data characteristics in a single pass
         if transactions:
-            amounts = []
+            amount_count = 0
+            amount_sum = 0
+            amount_min = amount_max = None
             accounts = set()
-            timestamps = []
+            ts_min = ts_max = None
             
             for tx in transactions:
-                # Collect amounts
+                # Running amount statistics
                 if 'amount' in tx and tx['amount'] is not None:
                     try:
-                        amounts.append(float(tx['amount']))
-                    except:
-                        pass
+                        amount = float(tx['amount'])
+                    except (TypeError, ValueError, OverflowError):
+                        amount = None
+                    if amount is not None:
+                        if amount_count == 0:
+                            amount_min = amount_max = amount
+                        elif amount < amount_min:
+                            amount_min = amount
+                        elif amount > amount_max:
+                            amount_max = amount
+                        amount_sum += amount
+                        amount_count += 1
                 
                 # Collect accounts
-                if 'account_id' in tx:
+                if account_ids is None and 'account_id' in tx:
                     accounts.add(str(tx['account_id']))
                 
-                # Collect timestamps
+                # Running timestamp range
                 if 'timestamp' in tx:
                     parsed_ts = self._parse_timestamp(tx['timestamp'])
                     if parsed_ts:
-                        timestamps.append(parsed_ts)
+                        if ts_min is None:
+                            ts_min = ts_max = parsed_ts
+                        elif parsed_ts < ts_min:
+                            ts_min = parsed_ts
+                        elif parsed_ts > ts_max:
+                            ts_max = parsed_ts
             
-            if amounts:
+            if amount_count:
                 summary['amount_stats'] = {
-                    'min': min(amounts),
-                    'max': max(amounts),
-                    'avg': sum(amounts) / len(amounts),
-                    'count': len(amounts)
+                    'min': amount_min,
+                    'max': amount_max,
+                    'avg': amount_sum / amount_count,
+                    'count': amount_count
                 }
             
-            summary['unique_accounts'] = len(accounts)
+            if account_ids is not None:
+                summary['unique_accounts'] = int(account_ids.nunique(dropna=True))
+            else:
+                summary['unique_accounts'] = len(accounts)
             
-            if timestamps:
+            if ts_min is not None:
                 summary['date_range'] = {
-                    'start': min(timestamps).isoformat(),
-                    'end': max(timestamps).isoformat(),
-                    'span_days': (max(timestamps) - min(timestamps)).days
+                    'start': ts_min.isoformat(),
+                    'end': ts_max.isoformat(),
+                    'span_days': (ts_max - ts_min).days
                 }
         
         return summary
 
 
+@dataclass
+class QualityContext:
+    """Columns parsed once per quality report and shared by every check."""
+    
+    df: pd.DataFrame
+    null_mask: pd.DataFrame
+    timestamps: Optional[pd.Series] = None
+    amounts: Optional[pd.Series] = None
+    
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame) -> 'QualityContext':
+        """Parse the timestamp and amount columns and compute the null mask."""
+        return cls(
+            df=df,
+            null_mask=df.isnull(),
+            # Quality scoring stays lenient: any timestamp pandas can read counts
+            timestamps=(
+                pd.to_datetime(df['timestamp'], format='mixed', utc=True, errors='coerce')
+                if 'timestamp' in df.columns else None
+            ),
+            amounts=pd.to_numeric(df['amount'], errors='coerce') if 'amount' in df.columns else None
+        )
+
+
 class DataQualityChecker:
     """Advanced data quality checking for transaction datasets."""
     
@@ -414,20 +898,23 @@ class DataQualityChecker:
             report['issues'].append("Dataset is empty")
             return report
         
+        # Parse the timestamp and amount columns once for all checks
+        ctx = QualityContext.from_dataframe(df)
+        
         # Check completeness
-        completeness = self._check_completeness(df)
+        completeness = self._check_completeness(ctx)
         report['statistics']['completeness'] = completeness
         
         # Check consistency
-        consistency = self._check_consistency(df)
+        consistency = self._check_consistency(ctx)
         report['statistics']['consistency'] = consistency
         
         # Check validity
-        validity = self._check_validity(df)
+        validity = self._check_validity(ctx)
         report['statistics']['validity'] = validity
         
         # Check uniqueness
-        uniqueness = self._check_uniqueness(df)
+        uniqueness = self._check_uniqueness(ctx)
         report['statistics']['uniqueness'] = uniqueness
         
         # Calculate overall quality score
@@ -458,12 +945,14 @@ class DataQualityChecker:
         
         return report
     
-    def _check_completeness(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _check_completeness(self, ctx: QualityContext) -> Dict[str, Any]:
         """Check data completeness."""
         result = {'score': 1.0, 'issues': [], 'recommendations': []}
+        df = ctx.df
         
         total_cells = len(df) * len(df.columns)
-        missing_cells = df.isnull().sum().sum()
+        missing_by_column = ctx.null_mask.sum()
+        missing_cells = missing_by_column.sum()
         completeness_rate = (total_cells - missing_cells) / total_cells
         
         result['completeness_rate'] = completeness_rate
@@ -478,62 +967,64 @@ class DataQualityChecker:
         required_cols = ['amount', 'timestamp', 'account_id']
         for col in required_cols:
             if col in df.columns:
-                missing_pct = df[col].isnull().mean()
+                missing_pct = missing_by_column[col] / len(df)
                 if missing_pct > 0:
                     result['issues'].append(f"Required column '{col}' has {missing_pct:.1%} missing values")
         
         return result
     
-    def _check_consistency(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _check_consistency(self, ctx: QualityContext) -> Dict[str, Any]:
         """Check data consistency."""
         result = {'score': 1.0, 'issues': [], 'recommendations': []}
+        timestamps, amounts = ctx.timestamps, ctx.amounts
         
         # Check timestamp consistency
-        if 'timestamp' in df.columns:
-            # Should be in chronological order ideally
-            ts_series = pd.to_datetime(df['timestamp'], errors='coerce')
-            if ts_series.isnull().any():
-                inconsistent_count = ts_series.isnull().sum()
+        if timestamps is not None:
+            if timestamps.isnull().any():
+                inconsistent_count = timestamps.isnull().sum()
                 result['issues'].append(f"{inconsistent_count} timestamps could not be parsed")
                 result['score'] *= 0.9
         
         # Check amount consistency (should be numeric)
-        if 'amount' in df.columns:
-            numeric_amounts = pd.to_numeric(df['amount'], errors='coerce')
-            if numeric_amounts.isnull().any():
-                non_numeric = numeric_amounts.isnull().sum()
+        if amounts is not None:
+            if amounts.isnull().any():
+                non_numeric = amounts.isnull().sum()
                 result['issues'].append(f"{non_numeric} amounts are not numeric")
                 result['score'] *= 0.9
         
         return result
     
-    def _check_validity(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _check_validity(self, ctx: QualityContext) -> Dict[str, Any]:
         """Check data validity."""
         result = {'score': 1.0, 'issues': [], 'recommendations': []}
+        timestamps, amounts = ctx.timestamps, ctx.amounts
         
         # Check for negative amounts
-        if 'amount' in df.columns:
-            negative_amounts = (pd.to_numeric(df['amount'], errors='coerce') < 0).sum()
+        if amounts is not None:
+            stats = _amount_stats(amounts.to_numpy(dtype=np.float64))
+            result['amount_stats'] = stats
+            negative_amounts = stats['negative_count']
             if negative_amounts > 0:
                 result['issues'].append(f"{negative_amounts} transactions have negative amounts")
                 result['score'] *= 0.95
         
         # Check for future dates
-        if 'timestamp' in df.columns:
-            ts_series = pd.to_datetime(df['timestamp'], errors='coerce')
-            future_dates = (ts_series > datetime.now()).sum()
+        if timestamps is not None:
+            future_dates = (timestamps > pd.Timestamp.now(tz='UTC')).sum()
             if future_dates > 0:
                 result['issues'].append(f"{future_dates} transactions have future timestamps")
                 result['score'] *= 0.98
         
         return result
     
-    def _check_uniqueness(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _check_uniqueness(self, ctx: QualityContext) -> Dict[str, Any]:
         """Check data uniqueness."""
         result = {'score': 1.0, 'issues': [], 'recommendations': []}
+        df = ctx.df
         
-        # Check for duplicate rows
-        duplicate_rows = df.duplicated().sum()
+        # Check for duplicate rows by comparing one 64-bit hash per row
+        row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+        duplicate_rows = len(row_hashes) - len(pd.unique(row_hashes))
         if duplicate_rows > 0:
             result['issues'].append(f"{duplicate_rows} duplicate rows found")
             result['recommendations'].append("Remove duplicate transactions")
@@ -1,13 +1,16 @@
 """Custom exceptions for the anomaly detection application."""
 
+import sys
+
 
 class AnomalyDetectionError(Exception):
     """Base exception for all anomaly detection related errors."""
     
     def __init__(self, message: str, error_code: str = None, details: dict = None):
         self.message = message
-        self.error_code = error_code
-        self.details = details or {}
+        # Error codes repeat across many instances; share one string object
+        self.error_code = sys.intern(error_code) if isinstance(error_code, str) else error_code
+        self.details = details if details is not None else {}
         super().__init__(self.message)
 
 
@@ -1,37 +1,189 @@
 """File validation utilities."""
 
+import codecs
+import copy
+import csv
+import hashlib
+import hmac
+import io
 import mimetypes
+import os
+import re
+import threading
+import xml.etree.ElementTree as ET
+import zipfile
 import magic
-from typing import Dict, Any, List, Optional
+import orjson
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, Iterable, List, Optional, Tuple, Union
 from pathlib import Path
 
+try:
+    from lxml import etree as lxml_etree
+except ImportError:  # pragma: no cover - lxml is optional for validation
+    lxml_etree = None
+
 from .exceptions import FileValidationError, UnsupportedFileTypeError
 from ..config import get_settings
 
 settings = get_settings()
 
+# Signing keys that are public placeholders and never enable trusted uploads
+_INSECURE_SIGNING_KEYS = frozenset({"your-secret-key-change-in-production"})
+
+# pandas is heavy to import and only needed for deep Excel checks
+_pd = None
+
+# Leading byte signatures of the binary and structured formats
+_SIGNATURES = {
+    'xlsx': (b'PK\x03\x04',),
+    'xls': (b'\xd0\xcf\x11\xe0',),
+    'json': (b'{', b'['),
+    'xml': (b'<?xml', b'<')
+}
+
+# MIME type reported once a file's type has been confirmed without libmagic
+_CANONICAL_MIME = {
+    'csv': 'text/csv',
+    'json': 'application/json',
+    'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    'xls': 'application/vnd.ms-excel',
+    'xml': 'application/xml',
+    'sie4': 'text/plain'
+}
+
+# Map extensions to our internal file types
+_EXTENSION_MAPPING = {
+    'csv': 'csv',
+    'json': 'json',
+    'xlsx': 'xlsx',
+    'xls': 'xls',
+    'xml': 'xml',
+    'sie4': 'sie4',
+    'sie': 'sie4'  # Alternative extension for SIE4
+}
+
+# Columns every row must provide, per file type
+_REQUIRED_COLUMNS = {
+    'csv': ('amount', 'timestamp', 'account_id'),
+    'json': (),  # JSON can have flexible structure
+    'xlsx': ('amount', 'timestamp', 'account_id'),
+    'xls': ('amount', 'timestamp', 'account_id'),
+    'xml': (),  # XML can have flexible structure
+    'sie4': ()  # SIE4 has its own format
+}
+
+
+def _sniff(head: bytes) -> Optional[str]:
+    """Return the file type whose signature starts the header, if any."""
+    # Text formats may start with a UTF-8 BOM and whitespace
+    text_head = head[3:] if head.startswith(b'\xef\xbb\xbf') else head
+    text_head = text_head.lstrip()
+    
+    for file_type, signatures in _SIGNATURES.items():
+        candidate = text_head if file_type in ('json', 'xml') else head
+        if candidate.startswith(signatures):
+            return file_type
+    return None
+
+
+def _validate_in_worker(max_file_size: int, deep: bool, source: Union[bytes, str, Path],
+                        filename: str, file_type: str) -> Dict[str, Any]:
+    """Validate one file inside a worker process of `FileValidator.validate_many`."""
+    if isinstance(source, (str, Path)):
+        # Read from disk here so large uploads are not pickled through the pool
+        source = Path(source).read_bytes()
+    return FileValidator(max_file_size=max_file_size, deep=deep).validate_file(
+        source, filename, file_type
+    )
+
 
 class FileValidator:
     """Validator for uploaded files."""
     
     # MIME type mappings for supported file types
     SUPPORTED_MIME_TYPES = {
-        'csv': ['text/csv', 'application/csv', 'text/plain'],
-        'json': ['application/json', 'text/json'],
-        'xlsx': ['application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'],
-        'xls': ['application/vnd.ms-excel'],
-        'xml': ['application/xml', 'text/xml'],
-        'sie4': ['text/plain', 'application/octet-stream']  # SIE4 is text-based
+        'csv': frozenset({'text/csv', 'application/csv', 'text/plain'}),
+        'json': frozenset({'application/json', 'text/json'}),
+        'xlsx': frozenset({'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'}),
+        'xls': frozenset({'application/vnd.ms-excel'}),
+        'xml': frozenset({'application/xml', 'text/xml'}),
+        'sie4': frozenset({'text/plain', 'application/octet-stream'})  # SIE4 is text-based
     }
     
     # File size limits (in bytes)
     DEFAULT_MAX_SIZE = 100 * 1024 * 1024  # 100MB
     
-    def __init__(self, max_file_size: Optional[int] = None):
+    # Magic numbers live at the start of a file; only this much is sniffed
+    HEADER_SNIFF_BYTES = 16384
+    
+    # Results are memoized by content hash so re-uploads skip re-validation
+    RESULT_CACHE_SIZE = 256
+    RESULT_CACHE_MAX_FILE_SIZE = 50 * 1024 * 1024  # 50MB
+    
+    # Path traversal and characters that are unsafe in filenames
+    _DANGEROUS_RE = re.compile(r'\.\.|[/\\<>:"|?*]')
+    
+    # Compound File Binary (OLE2) header of legacy .xls workbooks
+    OLE2_SIGNATURE = b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'
+    
+    # libmagic cookies are not thread-safe, so each thread opens its own once
+    _magic_local = threading.local()
+    
+    def __init__(self, max_file_size: Optional[int] = None, deep: bool = False):
+        """
+        Args:
+            max_file_size: Maximum accepted file size in bytes
+            deep: Also parse Excel workbooks with pandas instead of only
+                checking their container structure
+        """
         self.max_file_size = max_file_size or settings.max_file_size or self.DEFAULT_MAX_SIZE
+        self.deep = deep
         self.allowed_types = settings.allowed_file_types or ['csv', 'json', 'xlsx', 'xls', 'xml']
+        self._result_cache: OrderedDict[Tuple[str, str, bytes], Dict[str, Any]] = OrderedDict()
+    
+    @classmethod
+    def _magic(cls) -> 'magic.Magic':
+        """Return this thread's MIME detector, loading the magic database once."""
+        detector = getattr(cls._magic_local, 'detector', None)
+        if detector is None:
+            detector = magic.Magic(mime=True)
+            cls._magic_local.detector = detector
+        return detector
     
-    def validate_file(self, file_content: bytes, filename: str, file_type: str) -> Dict[str, Any]:
+    @property
+    def _pandas(self):
+        """pandas, imported on first use since only deep Excel checks need it."""
+        global _pd
+        if _pd is None:
+            import pandas
+            _pd = pandas
+        return _pd
+    
+    @staticmethod
+    def _upload_signing_key() -> Optional[bytes]:
+        """Return the upload signing key, or None if trusted uploads are disabled."""
+        key = settings.upload_signing_key
+        if not key or key in _INSECURE_SIGNING_KEYS:
+            return None
+        return key.encode()
+    
+    @classmethod
+    def sign_content(cls, file_content: bytes) -> bytes:
+        """
+        Return the HMAC-SHA256 of the content under the upload signing key.
+        
+        Raises:
+            FileValidationError: If no usable upload signing key is configured
+        """
+        key = cls._upload_signing_key()
+        if key is None:
+            raise FileValidationError("Upload signing key is not configured")
+        return hmac.new(key, file_content, 'sha256').digest()
+    
+    def validate_file(self, file_content: bytes, filename: str, file_type: str,
+                      trusted_hmac: Optional[bytes] = None) -> Dict[str, Any]:
         """
         Comprehensive file validation.
         
@@ -39,6 +191,9 @@ class FileValidator:
             file_content: Raw file content as bytes
             filename: Original filename
             file_type: Detected or provided file type
+            trusted_hmac: Signature from `sign_content` by a trusted producer;
+                when it matches, MIME and content checks are skipped. Ignored
+                unless an upload signing key is configured
             
         Returns:
             Dictionary with validation results
@@ -55,30 +210,97 @@ class FileValidator:
             }
         }
         
+        # 1-3. Cheap metadata checks; any failure returns before hashing or parsing
         try:
-            # 1. File size validation
             self._validate_file_size(file_content, validation_result)
-            
-            # 2. File type validation
             self._validate_file_type(file_type, validation_result)
-            
-            # 3. Filename validation
             self._validate_filename(filename, validation_result)
+        except Exception as e:
+            validation_result['errors'].append(f"Validation error: {str(e)}")
+        
+        if validation_result['errors']:
+            validation_result['valid'] = False
+            return validation_result
+        
+        # Content signed by a trusted producer was already validated upstream;
+        # a signature that does not match, or arrives while no signing key is
+        # configured, falls through to the full checks
+        signing_key = self._upload_signing_key() if trusted_hmac is not None else None
+        if signing_key is not None and hmac.compare_digest(
+            hmac.new(signing_key, file_content, 'sha256').digest(), trusted_hmac
+        ):
+            validation_result['file_info']['mime_type'] = _CANONICAL_MIME.get(file_type)
+            return validation_result
+        
+        # Identical content is validated once; large files are not cached
+        cache_key = None
+        if len(file_content) <= self.RESULT_CACHE_MAX_FILE_SIZE:
+            digest = hashlib.blake2b(file_content, digest_size=16).digest()
+            cache_key = (filename, file_type, digest)
+            cached = self._result_cache.get(cache_key)
+            if cached is not None:
+                self._result_cache.move_to_end(cache_key)
+                return copy.deepcopy(cached)
+        
+        self._validate_file_content(file_content, filename, file_type, validation_result)
+        
+        if cache_key is not None:
+            self._result_cache[cache_key] = copy.deepcopy(validation_result)
+            if len(self._result_cache) > self.RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+        
+        return validation_result
+    
+    def validate_many(self, items: Iterable[Tuple[Union[bytes, str, Path], str, str]],
+                      max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Validate several files in parallel worker processes.
+        
+        Args:
+            items: (content, filename, file_type) tuples; content is either the
+                raw bytes or a path the worker reads itself, which avoids copying
+                large files between processes
+            max_workers: Number of worker processes (defaults to the CPU count)
             
+        Returns:
+            Validation results in the same order as the items
+        """
+        items = list(items)
+        if len(items) <= 1:
+            # Not worth starting a pool; validate inline and keep using the cache
+            return [
+                self.validate_file(
+                    Path(source).read_bytes() if isinstance(source, (str, Path)) else source,
+                    filename, file_type
+                )
+                for source, filename, file_type in items
+            ]
+        
+        workers = min(max_workers or os.cpu_count() or 1, len(items))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_validate_in_worker, self.max_file_size, self.deep,
+                                source, filename, file_type)
+                for source, filename, file_type in items
+            ]
+            return [future.result() for future in futures]
+    
+    def _validate_file_content(self, file_content: bytes, filename: str, file_type: str,
+                               result: Dict[str, Any]) -> None:
+        """Run the content-level checks and set overall validity."""
+        try:
             # 4. MIME type validation
-            self._validate_mime_type(file_content, filename, file_type, validation_result)
+            self._validate_mime_type(file_content, filename, file_type, result)
             
             # 5. Content validation (basic checks)
-            self._validate_content(file_content, file_type, validation_result)
+            self._validate_content(file_content, file_type, result)
             
             # Set overall validity
-            validation_result['valid'] = len(validation_result['errors']) == 0
+            result['valid'] = len(result['errors']) == 0
             
         except Exception as e:
-            validation_result['valid'] = False
-            validation_result['errors'].append(f"Validation error: {str(e)}")
-        
-        return validation_result
+            result['valid'] = False
+            result['errors'].append(f"Validation error: {str(e)}")
     
     def _validate_file_size(self, file_content: bytes, result: Dict[str, Any]) -> None:
         """Validate file size."""
@@ -111,12 +333,10 @@ class FileValidator:
             result['errors'].append("Filename is required")
             return
         
-        # Check for dangerous characters
-        dangerous_chars = ['..', '/', '\\', '<', '>', ':', '"', '|', '?', '*']
-        for char in dangerous_chars:
-            if char in filename:
-                result['errors'].append(f"Filename contains dangerous character: {char}")
-                break
+        # Check for dangerous characters in a single scan
+        match = self._DANGEROUS_RE.search(filename)
+        if match:
+            result['errors'].append(f"Filename contains dangerous character: {match.group(0)}")
         
         # Check filename length
         if len(filename) > 255:
@@ -129,19 +349,34 @@ class FileValidator:
     def _validate_mime_type(self, file_content: bytes, filename: str, file_type: str, 
                           result: Dict[str, Any]) -> None:
         """Validate MIME type."""
+        # Fast path: a matching signature, or a plain-text type whose extension
+        # agrees, is enough for the closed set of types we accept
+        sniffed_type = _sniff(file_content[:64])
+        extension_type = self.get_file_type_from_filename(filename)
+        if sniffed_type == file_type or (
+            sniffed_type is None and file_type not in _SIGNATURES and extension_type == file_type
+        ):
+            result['file_info']['mime_type'] = _CANONICAL_MIME.get(file_type)
+            return
+        
+        # Signature and extension disagree or are inconclusive: ask libmagic
         try:
-            # Get MIME type from file content
-            detected_mime = magic.from_buffer(file_content, mime=True)
+            # Get MIME type from the file header
+            detected_mime = self._magic().from_buffer(file_content[:self.HEADER_SNIFF_BYTES])
             result['file_info']['mime_type'] = detected_mime
             
             # Check if detected MIME type matches expected type
-            expected_mimes = self.SUPPORTED_MIME_TYPES.get(file_type, [])
+            expected_mimes = self.SUPPORTED_MIME_TYPES.get(file_type, frozenset())
+            
+            # Office Open XML workbooks are ZIP containers and often sniff as plain ZIP
+            if detected_mime == 'application/zip' and file_type == 'xlsx':
+                return
             
             if detected_mime not in expected_mimes:
                 # Some files might have generic MIME types, so add warning instead of error
                 result['warnings'].append(
                     f"MIME type '{detected_mime}' doesn't match expected type for {file_type}. "
-                    f"Expected: {', '.join(expected_mimes)}"
+                    f"Expected: {', '.join(sorted(expected_mimes))}"
                 )
             
         except Exception as e:
@@ -151,7 +386,7 @@ class FileValidator:
                 result['file_info']['mime_type'] = guessed_mime
                 
                 if guessed_mime:
-                    expected_mimes = self.SUPPORTED_MIME_TYPES.get(file_type, [])
+                    expected_mimes = self.SUPPORTED_MIME_TYPES.get(file_type, frozenset())
                     if guessed_mime not in expected_mimes:
                         result['warnings'].append(
                             f"Guessed MIME type '{guessed_mime}' doesn't match expected type for {file_type}"
@@ -171,65 +406,113 @@ class FileValidator:
         elif file_type == 'xml':
             self._validate_xml_content(file_content, result)
         elif file_type in ['xlsx', 'xls']:
-            self._validate_excel_content(file_content, result)
+            self._validate_excel_content(file_content, file_type, result)
     
     def _validate_json_content(self, file_content: bytes, result: Dict[str, Any]) -> None:
         """Basic JSON content validation."""
         try:
-            import json
-            content = file_content.decode('utf-8')
-            json.loads(content)
-        except UnicodeDecodeError:
-            result['errors'].append("JSON file has invalid encoding (expected UTF-8)")
-        except json.JSONDecodeError as e:
+            # orjson parses the UTF-8 bytes directly, without a decoded str copy
+            orjson.loads(file_content)
+        except orjson.JSONDecodeError as e:
+            # Only decode to tell encoding problems apart on the failure path
+            try:
+                file_content.decode('utf-8')
+            except UnicodeDecodeError:
+                result['errors'].append("JSON file has invalid encoding (expected UTF-8)")
+                return
             result['errors'].append(f"Invalid JSON format: {str(e)}")
     
     def _validate_csv_content(self, file_content: bytes, result: Dict[str, Any]) -> None:
         """Basic CSV content validation."""
         try:
-            import csv
-            import io
+            encoding = self._detect_text_encoding(file_content)
+            text_stream = io.TextIOWrapper(io.BytesIO(file_content), encoding=encoding, newline='')
+            csv_reader = csv.reader(text_stream)
             
-            # Try different encodings
-            for encoding in ['utf-8', 'latin-1', 'cp1252']:
-                try:
-                    content = file_content.decode(encoding)
-                    csv_reader = csv.reader(io.StringIO(content))
-                    # Try to read first row
-                    next(csv_reader)
-                    break
-                except UnicodeDecodeError:
-                    continue
-                except StopIteration:
-                    result['warnings'].append("CSV file appears to be empty")
-                    break
-                except csv.Error as e:
-                    result['errors'].append(f"CSV format error: {str(e)}")
-                    break
-            else:
+            # Try to read first row
+            try:
+                next(csv_reader)
+            except UnicodeDecodeError:
                 result['errors'].append("Could not decode CSV file with any supported encoding")
+            except StopIteration:
+                result['warnings'].append("CSV file appears to be empty")
+            except csv.Error as e:
+                result['errors'].append(f"CSV format error: {str(e)}")
                 
         except Exception as e:
             result['warnings'].append(f"CSV validation error: {str(e)}")
     
+    @staticmethod
+    def _detect_text_encoding(file_content: bytes) -> str:
+        """
+        Pick the encoding for a text upload from its byte order mark or head.
+        
+        Args:
+            file_content: Raw file content as bytes
+            
+        Returns:
+            'utf-8-sig' or 'utf-16' when a BOM is present, 'utf-8' when the
+            first 64 KiB decode as UTF-8, otherwise 'latin-1'
+        """
+        if file_content.startswith(codecs.BOM_UTF8):
+            return 'utf-8-sig'
+        if file_content.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+            return 'utf-16'
+        
+        # Incremental decode so a multi-byte character cut at the boundary is fine
+        try:
+            codecs.getincrementaldecoder('utf-8')().decode(file_content[:65536], final=False)
+            return 'utf-8'
+        except UnicodeDecodeError:
+            return 'latin-1'
+    
     def _validate_xml_content(self, file_content: bytes, result: Dict[str, Any]) -> None:
         """Basic XML content validation."""
+        if lxml_etree is not None:
+            try:
+                # Stream the raw bytes through libxml2, freeing each finished
+                # element so memory stays proportional to nesting depth
+                for _, element in lxml_etree.iterparse(
+                    io.BytesIO(file_content), events=('end',),
+                    resolve_entities=False, no_network=True
+                ):
+                    element.clear()
+                    # The root has no parent; its top-level comment and
+                    # processing-instruction siblings are left alone
+                    parent = element.getparent()
+                    if parent is not None:
+                        while element.getprevious() is not None:
+                            del parent[0]
+            except lxml_etree.XMLSyntaxError as e:
+                result['errors'].append(f"Invalid XML format: {str(e)}")
+            return
+        
         try:
-            import xml.etree.ElementTree as ET
             ET.fromstring(file_content.decode('utf-8'))
         except UnicodeDecodeError:
             result['errors'].append("XML file has invalid encoding (expected UTF-8)")
         except ET.ParseError as e:
             result['errors'].append(f"Invalid XML format: {str(e)}")
     
-    def _validate_excel_content(self, file_content: bytes, result: Dict[str, Any]) -> None:
-        """Basic Excel content validation."""
+    def _validate_excel_content(self, file_content: bytes, file_type: str,
+                                result: Dict[str, Any]) -> None:
+        """
+        Basic Excel content validation.
+        
+        Checks the container structure (ZIP central directory for xlsx, OLE2
+        header for xls); the workbook itself is only parsed in deep mode.
+        """
         try:
-            import pandas as pd
-            import io
+            if file_type == 'xlsx':
+                with zipfile.ZipFile(io.BytesIO(file_content)) as workbook:
+                    if 'xl/workbook.xml' not in workbook.namelist():
+                        raise ValueError("workbook part xl/workbook.xml not found")
+            elif not file_content.startswith(self.OLE2_SIGNATURE):
+                raise ValueError("file is not an OLE2 compound document")
             
-            # Try to read the Excel file
-            pd.read_excel(io.BytesIO(file_content), nrows=1)
+            if self.deep:
+                # Try to read the Excel file
+                self._pandas.read_excel(io.BytesIO(file_content), nrows=1)
             
         except Exception as e:
             result['errors'].append(f"Excel file validation error: {str(e)}")
@@ -239,20 +522,12 @@ class FileValidator:
         if not filename:
             return None
         
-        extension = Path(filename).suffix.lower().lstrip('.')
-        
-        # Map extensions to our internal file types
-        extension_mapping = {
-            'csv': 'csv',
-            'json': 'json',
-            'xlsx': 'xlsx',
-            'xls': 'xls',
-            'xml': 'xml',
-            'sie4': 'sie4',
-            'sie': 'sie4'  # Alternative extension for SIE4
-        }
+        # A leading dot marks a hidden file, not an extension
+        dot = filename.rfind('.')
+        if dot <= 0:
+            return None
         
-        return extension_mapping.get(extension)
+        return _EXTENSION_MAPPING.get(filename[dot + 1:].lower())
     
     def is_file_type_supported(self, file_type: str) -> bool:
         """Check if file type is supported."""
@@ -264,21 +539,13 @@ class FileValidator:
     
     def validate_required_columns(self, columns: List[str], file_type: str) -> Dict[str, Any]:
         """Validate that required columns are present."""
-        required_columns = {
-            'csv': ['amount', 'timestamp', 'account_id'],
-            'json': [],  # JSON can have flexible structure
-            'xlsx': ['amount', 'timestamp', 'account_id'],
-            'xls': ['amount', 'timestamp', 'account_id'],
-            'xml': [],  # XML can have flexible structure
-            'sie4': []  # SIE4 has its own format
-        }
-        
-        required = required_columns.get(file_type, [])
-        missing = [col for col in required if col not in [c.lower() for c in columns]]
+        required = _REQUIRED_COLUMNS.get(file_type, ())
+        present = {c.lower() for c in columns}
+        missing = [col for col in required if col not in present]
         
         result = {
             'valid': len(missing) == 0,
-            'required_columns': required,
+            'required_columns': list(required),
             'missing_columns': missing,
             'present_columns': columns
         }
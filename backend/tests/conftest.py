@@ -29,6 +29,30 @@ from app.config import get_settings
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
 
+# Slow tests are skipped by default; pass --runslow to include them
+def pytest_addoption(parser):
+    """Add command line options for the test suite."""
+    parser.addoption(
+        "--runslow", action="store_true", default=False, help="run tests marked as slow"
+    )
+
+
+def pytest_configure(config):
+    """Register custom markers."""
+    config.addinivalue_line("markers", "slow: large-dataset test, skipped unless --runslow is given")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked as slow unless --runslow is given."""
+    if config.getoption("--runslow"):
+        return
+    
+    skip_slow = pytest.mark.skip(reason="need --runslow option to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
 @pytest.fixture(scope="session")
 def event_loop():
     """Create an instance of the default event loop for the test session."""
@@ -84,7 +108,7 @@ async def client(db_session) -> AsyncGenerator[AsyncClient, None]:
 
 
 # Sample data fixtures
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_csv_content() -> bytes:
     """Sample CSV content for testing."""
     return b"""amount,timestamp,account_id,external_transaction_id
@@ -95,7 +119,7 @@ def sample_csv_content() -> bytes:
 1000.00,2023-01-01T14:00:00Z,ACC003,TXN005"""
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_json_content() -> bytes:
     """Sample JSON content for testing."""
     return b"""[
@@ -1,7 +1,6 @@
 """Tests for upload API endpoints."""
 
 import pytest
-import tempfile
 import os
 from unittest.mock import AsyncMock, patch
 from httpx import AsyncClient
@@ -11,54 +10,81 @@ import uuid
 from app.models.upload import FileUpload
 
 
+@pytest.fixture(scope="session")
+def upload_tmp_dir(tmp_path_factory):
+    """Directory shared by all upload tests for their source files."""
+    return tmp_path_factory.mktemp("uploads")
+
+
+@pytest.fixture(scope="session")
+def csv_tmpfile(upload_tmp_dir, sample_csv_content):
+    """Sample CSV written to disk once per session."""
+    path = upload_tmp_dir / "test.csv"
+    path.write_bytes(sample_csv_content)
+    return path
+
+
+@pytest.fixture(scope="session")
+def json_tmpfile(upload_tmp_dir, sample_json_content):
+    """Sample JSON written to disk once per session."""
+    path = upload_tmp_dir / "test.json"
+    path.write_bytes(sample_json_content)
+    return path
+
+
+class _ChunkedUpload:
+    """File-like body that produces ``total`` bytes on demand.
+
+    httpx streams multipart file fields by calling ``read`` repeatedly, so
+    large uploads can be tested without holding the payload in memory.
+    """
+
+    def __init__(self, total: int, fill: bytes = b"a"):
+        self.total = total
+        self.fill = fill
+        self.sent = 0
+
+    def read(self, size: int = -1) -> bytes:
+        remaining = self.total - self.sent
+        n = remaining if size < 0 else min(size, remaining)
+        self.sent += n
+        return self.fill * n
+
+
 class TestUploadAPI:
     """Test cases for upload API endpoints."""
 
     @pytest.mark.asyncio
-    async def test_upload_file_csv_success(self, client: AsyncClient, sample_csv_content: bytes):
+    async def test_upload_file_csv_success(self, client: AsyncClient, csv_tmpfile):
         """Test successful CSV file upload."""
-        with tempfile.NamedTemporaryFile(suffix='.csv', delete=False) as tmp_file:
-            tmp_file.write(sample_csv_content)
-            tmp_file_path = tmp_file.name
-
-        try:
-            with open(tmp_file_path, 'rb') as f:
-                response = await client.post(
-                    "/api/v1/upload",
-                    files={"file": ("test.csv", f, "text/csv")},
-                    data={"auto_analyze": "false"}
-                )
+        with open(csv_tmpfile, 'rb') as f:
+            response = await client.post(
+                "/api/v1/upload",
+                files={"file": ("test.csv", f, "text/csv")},
+                data={"auto_analyze": "false"}
+            )
 
-            assert response.status_code == status.HTTP_200_OK
-            data = response.json()
-            assert "id" in data
-            assert data["original_filename"] == "test.csv"
-            assert data["file_type"] == "csv"
-            assert data["status"] == "uploaded"
-        finally:
-            os.unlink(tmp_file_path)
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert "id" in data
+        assert data["original_filename"] == "test.csv"
+        assert data["file_type"] == "csv"
+        assert data["status"] == "uploaded"
 
     @pytest.mark.asyncio
-    async def test_upload_file_json_success(self, client: AsyncClient, sample_json_content: bytes):
+    async def test_upload_file_json_success(self, client: AsyncClient, json_tmpfile):
         """Test successful JSON file upload."""
-        with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as tmp_file:
-            tmp_file.write(sample_json_content)
-            tmp_file_path = tmp_file.name
-
-        try:
-            with open(tmp_file_path, 'rb') as f:
-                response = await client.post(
-                    "/api/v1/upload",
-                    files={"file": ("test.json", f, "application/json")},
-                    data={"auto_analyze": "true", "strategy_id": str(uuid.uuid4())}
-                )
+        with open(json_tmpfile, 'rb') as f:
+            response = await client.post(
+                "/api/v1/upload",
+                files={"file": ("test.json", f, "application/json")},
+                data={"auto_analyze": "true", "strategy_id": str(uuid.uuid4())}
+            )
 
-            assert response.status_code == status.HTTP_200_OK
-            data = response.json()
-            assert data["file_type"] == "json"
-            assert data["metadata"]["auto_analyze"] is True
-        finally:
-            os.unlink(tmp_file_path)
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["file_type"] == "json"
+        assert data["metadata"]["auto_analyze"] is True
 
     @pytest.mark.asyncio
     async def test_upload_file_invalid_type(self, client: AsyncClient):
@@ -77,19 +103,46 @@ class TestUploadAPI:
     @pytest.mark.asyncio
     async def test_upload_file_too_large(self, client: AsyncClient):
         """Test upload with file that's too large."""
-        # Create a large file content (simulate large file)
-        large_content = b"a" * (100 * 1024 * 1024)  # 100MB
+        # The endpoint streams the body and stops once it passes the limit
+        large_content = _ChunkedUpload(2 * 1024 * 1024)  # 2MB
         
-        with patch("app.utils.file_validators.FileValidator.validate_file_size") as mock_validate:
-            mock_validate.side_effect = Exception("File too large")
-            
+        with patch("app.api.upload.file_validator.max_file_size", 1024 * 1024):
             response = await client.post(
                 "/api/v1/upload",
                 files={"file": ("large.csv", large_content, "text/csv")},
                 data={"auto_analyze": "false"}
             )
 
-        assert response.status_code == status.HTTP_500_OK
+        assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+        assert "exceeds maximum allowed size" in response.json()["detail"]
+
+    @pytest.mark.asyncio
+    async def test_upload_large_csv_validated_from_head(self, client: AsyncClient):
+        """Test a CSV larger than one chunk is validated from its first chunk only."""
+        from app.api.upload import UPLOAD_CHUNK_SIZE, file_processor
+
+        rows = b"".join(
+            b"%d.50,2023-01-01 10:00:00,ACC%03d\n" % (i, i % 100) for i in range(60000)
+        )
+        content = b"amount,timestamp,account_id\n" + rows
+        assert len(content) > UPLOAD_CHUNK_SIZE
+
+        with patch.object(
+            file_processor, "validate_file", wraps=file_processor.validate_file
+        ) as validate_file:
+            response = await client.post(
+                "/api/v1/upload",
+                files={"file": ("large.csv", content, "text/csv")},
+                data={"auto_analyze": "false"}
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        validated = validate_file.call_args.args[0]
+        assert len(validated) <= UPLOAD_CHUNK_SIZE
+        assert validated.endswith(b"\n")
+        data = response.json()
+        assert data["file_size"] == len(content)
+        assert data["metadata"]["validation_result"]["file_info"]["file_size"] == len(content)
 
     @pytest.mark.asyncio
     async def test_upload_file_invalid_structure(self, client: AsyncClient):
@@ -126,6 +179,18 @@ class TestUploadAPI:
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
+    @pytest.mark.asyncio
+    async def test_get_upload_status_batch(self, client: AsyncClient, sample_uploads):
+        """Test getting the status of several uploads in one request."""
+        requested = [sample_uploads[2], sample_uploads[0]]
+        ids = [str(upload.id) for upload in requested] + [str(uuid.uuid4())]
+        response = await client.post("/api/v1/upload/status/batch", json={"ids": ids})
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert [item["id"] for item in data] == ids[:2]
+        assert [item["status"] for item in data] == [upload.status for upload in requested]
+
     @pytest.mark.asyncio
     async def test_get_upload_history_success(self, client: AsyncClient, db_session, sample_uploads):
         """Test getting upload history with pagination."""
@@ -260,8 +325,8 @@ class TestUploadAPI:
                 data={"auto_analyze": "false"}
             )
 
-        # Simulate multiple concurrent uploads
-        tasks = [upload_file(f"test_{i}.csv") for i in range(3)]
+        # Enough in-flight requests to interleave on the event loop
+        tasks = [upload_file(f"test_{i}.csv") for i in range(32)]
         responses = await asyncio.gather(*tasks)
 
         # All uploads should succeed
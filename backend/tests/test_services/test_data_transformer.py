@@ -13,9 +13,9 @@ from app.utils.exceptions import DataTransformationError
 class TestDataTransformerService:
     """Test cases for data transformer service."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def service(self):
-        """Create data transformer service instance."""
+        """Create data transformer service instance (stateless, shared)."""
         return DataTransformerService()
 
     @pytest.fixture
@@ -219,6 +219,15 @@ class TestDataTransformerService:
         assert result_df.iloc[0]['account_id'] == "ACC001"
         assert result_df.iloc[1]['account_id'] == "ACC002"
 
+    def test_repeated_identifiers_are_categorical(self, service, sample_raw_transactions):
+        """Test that account and upload IDs are stored as categoricals."""
+        result_df = service.transform_transactions(sample_raw_transactions, "test-upload")
+        
+        assert isinstance(result_df['account_id'].dtype, pd.CategoricalDtype)
+        assert isinstance(result_df['upload_id'].dtype, pd.CategoricalDtype)
+        assert set(result_df['account_id']) == {'ACC001', 'ACC002'}
+        assert list(result_df['upload_id'].cat.categories) == ["test-upload"]
+
     def test_derived_fields_creation(self, service):
         """Test creation of derived time-based and amount-based fields."""
         data = [
@@ -435,6 +444,47 @@ class TestDataTransformerService:
         assert execution_time < 30  # 30 seconds threshold
         assert len(result_df) == 5000
 
+    def test_transform_transactions_chunked(self, service):
+        """Test that chunked transformation matches the single-batch result."""
+        data = [
+            {
+                "id": f"TXN{i:03d}",
+                "amount": "invalid" if i % 7 == 0 else 100.0 + i,
+                "timestamp": f"2023-01-{(i % 28) + 1:02d}T{(i % 24):02d}:00:00Z",
+                "account_id": f"acc{(i % 3) + 1:03d}"
+            }
+            for i in range(50)
+        ]
+        
+        expected = service.transform_transactions(data, "test-upload")
+        result = service.transform_transactions_chunked(iter(data), "test-upload", chunk_size=8)
+        
+        columns = ['id', 'amount', 'timestamp', 'account_id', 'transaction_sequence',
+                   'time_since_prev_hours']
+        pd.testing.assert_frame_equal(result[columns], expected[columns])
+        assert isinstance(result['account_id'].dtype, pd.CategoricalDtype)
+
+    def test_transform_chunked_missing_column(self, service):
+        """Test a required column absent from every chunk is reported by name."""
+        data = [
+            {"timestamp": "2023-01-01T10:00:00Z", "account_id": f"ACC{i:03d}"}
+            for i in range(20)
+        ]
+        
+        with pytest.raises(DataTransformationError, match=r"Missing required fields: \['amount'\]"):
+            service.transform_transactions_chunked(iter(data), "test-upload", chunk_size=8)
+
+    def test_transform_chunked_column_missing_in_one_chunk(self, service):
+        """Test a chunk lacking a required column only drops its own rows."""
+        data = [
+            {"amount": 100.0 + i, "timestamp": "2023-01-01T10:00:00Z", "account_id": "ACC001"}
+            for i in range(8)
+        ] + [{"timestamp": "2023-01-01T10:00:00Z", "account_id": "ACC002"}] * 8
+        
+        result = service.transform_transactions_chunked(iter(data), "test-upload", chunk_size=8)
+        
+        assert len(result) == 8
+
     def test_error_handling_with_mixed_data(self, service):
         """Test error handling with mixed valid/invalid data."""
         mixed_data = [
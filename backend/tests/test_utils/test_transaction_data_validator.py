@@ -0,0 +1,108 @@
+"""Tests for amount and timestamp handling in the transaction validators and quality checker."""
+
+import pytest
+from datetime import datetime
+from decimal import Decimal
+
+import pandas as pd
+
+from app.utils.data_validators import DataQualityChecker, TransactionDataValidator
+
+
+# Timestamps the scalar validator rejects; pandas would accept most of them
+# under format='mixed'
+INVALID_TIMESTAMPS = [
+    'now',
+    '2023',
+    'Jan 5 2023',
+    '2023-13-01',
+    '2023-01-05T10:00:00.1234567Z',
+    1700000000,
+]
+
+VALID_TIMESTAMPS = [
+    '2023-01-05 10:00:00',
+    '2023-01-05T10:00:00',
+    '2023-01-05T10:00:00Z',
+    '2023-01-05T10:00:00.123Z',
+    '2023-01-05',
+    '25/12/2023 10:00:00',
+    '05/01/2023',
+    '12/25/2023',
+    datetime(2023, 1, 5, 10, 0),
+    # Outside the nanosecond range pandas parses into by default
+    '9999-12-31',
+    '2262-04-12',
+    '0001-01-01',
+    datetime(9999, 1, 1),
+]
+
+
+class TestTransactionDataValidator:
+    """Test cases for TransactionDataValidator batch validation."""
+
+    @pytest.fixture(scope="module")
+    def validator(self):
+        """Create TransactionDataValidator instance."""
+        return TransactionDataValidator()
+
+    @pytest.fixture(scope="module")
+    def transactions(self):
+        """Transactions covering valid and invalid timestamps."""
+        return [
+            {'amount': 100.0, 'timestamp': timestamp, 'account_id': 'ACC001'}
+            for timestamp in VALID_TIMESTAMPS + INVALID_TIMESTAMPS
+        ]
+
+    def test_vectorized_matches_scalar(self, validator, transactions):
+        """Test both batch validators flag the same rows with the same messages."""
+        scalar = validator.validate_transaction_batch(transactions)
+        vectorized = validator.validate_transaction_batch_vectorized(transactions)
+
+        assert vectorized['transaction_errors'] == scalar['transaction_errors']
+        assert vectorized['errors'] == scalar['errors']
+        assert vectorized['warnings'] == scalar['warnings']
+        assert vectorized['valid_transactions'] == scalar['valid_transactions']
+
+    def test_vectorized_rejects_invalid_timestamps(self, validator, transactions):
+        """Test timestamps outside DATE_FORMATS are errors in the vectorized path."""
+        result = validator.validate_transaction_batch_vectorized(transactions)
+
+        invalid_rows = range(len(VALID_TIMESTAMPS), len(transactions))
+        assert sorted(result['transaction_errors']) == list(invalid_rows)
+        assert result['transaction_errors'][len(transactions) - 1]['errors'] == [
+            "Unsupported timestamp type: <class 'int'>"
+        ]
+
+    def test_overlong_amount_is_invalid(self, validator):
+        """Test amounts past the int conversion limit are rejected, not raised."""
+        transactions = [{'amount': '1' * 5000, 'timestamp': '2023-01-05', 'account_id': 'ACC001'}]
+
+        for validate in (validator.validate_transaction_batch,
+                         validator.validate_transaction_batch_vectorized):
+            result = validate(transactions)
+            assert result['valid_transactions'] == 0
+            assert result['transaction_errors'][0]['errors'][0].startswith("Invalid amount format")
+
+    @pytest.mark.parametrize("amount", [Decimal('1E+999999999'), Decimal('1E-999999999')])
+    def test_extreme_exponent_is_invalid(self, validator, amount):
+        """Test non-string amounts with huge exponents are rejected without expanding them."""
+        result = validator._validate_amount(amount)
+
+        assert result['errors'] == [f"Invalid amount format: {amount}"]
+
+
+class TestDataQualityChecker:
+    """Test cases for timestamp parsing in DataQualityChecker."""
+
+    def test_consistency_accepts_any_pandas_timestamp(self):
+        """Test quality scoring does not restrict timestamps to DATE_FORMATS."""
+        df = pd.DataFrame({
+            'amount': [100.0, 200.0],
+            'timestamp': ['2023-01-01 10:00', 'Jan 2 2023'],
+            'account_id': ['ACC001', 'ACC002']
+        })
+
+        report = DataQualityChecker().check_data_quality(df)
+
+        assert report['statistics']['consistency']['score'] == 1.0
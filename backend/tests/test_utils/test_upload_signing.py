@@ -0,0 +1,65 @@
+"""Tests for trusted (pre-signed) upload validation."""
+
+import pytest
+
+from app.utils import file_validators
+from app.utils.exceptions import FileValidationError
+from app.utils.file_validators import FileValidator
+
+
+SIGNING_KEY = "test-upload-signing-key-0123456789"
+
+# Content that fails the JSON content checks unless they are skipped
+INVALID_JSON = b"not json"
+
+
+@pytest.fixture
+def validator():
+    """Create a FileValidator with an empty result cache."""
+    return FileValidator()
+
+
+@pytest.fixture
+def signing_key(monkeypatch):
+    """Configure an upload signing key for the test."""
+    monkeypatch.setattr(file_validators.settings, "upload_signing_key", SIGNING_KEY)
+    return SIGNING_KEY
+
+
+def test_matching_signature_skips_content_checks(validator, signing_key):
+    """Test a valid signature from a trusted producer skips content checks."""
+    signature = FileValidator.sign_content(INVALID_JSON)
+    result = validator.validate_file(INVALID_JSON, "data.json", "json", trusted_hmac=signature)
+
+    assert result["valid"] is True
+    assert result["file_info"]["mime_type"] == "application/json"
+
+
+def test_wrong_signature_runs_content_checks(validator, signing_key):
+    """Test a signature that does not match falls through to the full checks."""
+    signature = FileValidator.sign_content(b"other content")
+    result = validator.validate_file(INVALID_JSON, "data.json", "json", trusted_hmac=signature)
+
+    assert result["valid"] is False
+    assert any("Invalid JSON" in error for error in result["errors"])
+
+
+def test_absent_signature_runs_content_checks(validator, signing_key):
+    """Test content without a signature gets the full checks."""
+    result = validator.validate_file(INVALID_JSON, "data.json", "json")
+
+    assert result["valid"] is False
+
+
+@pytest.mark.parametrize("key", [None, "", "your-secret-key-change-in-production"])
+def test_trusted_mode_refused_without_usable_key(validator, monkeypatch, key):
+    """Test signatures are ignored and signing fails while no usable key is set."""
+    monkeypatch.setattr(file_validators.settings, "upload_signing_key", SIGNING_KEY)
+    signature = FileValidator.sign_content(INVALID_JSON)
+    monkeypatch.setattr(file_validators.settings, "upload_signing_key", key)
+
+    result = validator.validate_file(INVALID_JSON, "data.json", "json", trusted_hmac=signature)
+    assert result["valid"] is False
+
+    with pytest.raises(FileValidationError):
+        FileValidator.sign_content(INVALID_JSON)
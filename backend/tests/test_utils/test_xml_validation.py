@@ -0,0 +1,33 @@
+"""Tests for XML content validation."""
+
+import pytest
+
+from app.utils.file_validators import FileValidator
+
+
+@pytest.fixture
+def validator():
+    """Create a FileValidator with an empty result cache."""
+    return FileValidator()
+
+
+@pytest.mark.parametrize("content", [
+    b'<?xml version="1.0"?><!-- export --><root/>',
+    b'<?xml version="1.0"?>\n<?xml-stylesheet type="text/xsl" href="s.xsl"?>\n'
+    b'<transactions><transaction><amount>1</amount></transaction></transactions>',
+    b'<root><!-- note --><a/><?pi data?><b/></root>',
+])
+def test_xml_with_comments_and_processing_instructions(validator, content):
+    """Test top-level and nested comments or processing instructions are accepted."""
+    result = validator.validate_file(content, "data.xml", "xml")
+
+    assert result["errors"] == []
+    assert result["valid"] is True
+
+
+def test_malformed_xml_rejected(validator):
+    """Test mismatched tags are reported as invalid XML."""
+    result = validator.validate_file(b"<root><a></root>", "data.xml", "xml")
+
+    assert result["valid"] is False
+    assert any("Invalid XML format" in error for error in result["errors"])